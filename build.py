@@ -236,6 +236,8 @@ def run_cmake_build(
     build_dir: Path,
     wasi: bool,
     cmake_extra_args: list,
+    jobs: Optional[int] = None,
+    copy_compile_commands: bool = True,
 ) -> None:
     """
     Phase 3: Configure and build the project.
@@ -244,6 +246,8 @@ def run_cmake_build(
         build_dir: Build output directory
         wasi: True for WASI target, False for native
         cmake_extra_args: Additional CMake arguments
+        jobs: Parallel compile jobs (default: CPU count)
+        copy_compile_commands: Copy compile_commands.json to the repo root
     """
     print(f"\n[Phase 3] Build: CMake + {'Ninja' if shutil.which('ninja') else 'Make'}")
     print(f" Directory: {build_dir}")
@@ -271,14 +275,16 @@ def run_cmake_build(
     # Build
     print(" Compiling...")
     if use_ninja:
-        jobs = multiprocessing.cpu_count()
+        jobs = jobs or multiprocessing.cpu_count()
         subprocess.run(["ninja", "-j", str(jobs)], cwd=build_dir, check=True)
+    elif jobs:
+        subprocess.run(["cmake", "--build", ".", "--parallel", str(jobs)], cwd=build_dir, check=True)
     else:
         subprocess.run(["cmake", "--build", "."], cwd=build_dir, check=True)
 
     # Copy compile_commands.json for IDE
     compile_commands = build_dir / "compile_commands.json"
-    if compile_commands.exists():
+    if copy_compile_commands and compile_commands.exists():
         shutil.copy(compile_commands, _ROOT_DIR / "compile_commands.json")
 
 
@@ -339,7 +345,13 @@ def run_post_processing(
 # =============================================================================
 
 
-def build(wasi: bool = False, examples: Optional[List[str]] = None, run_tests: bool = False) -> None:
+def build(
+    wasi: bool = False,
+    examples: Optional[List[str]] = None,
+    run_tests: bool = False,
+    jobs: Optional[int] = None,
+    copy_compile_commands: bool = True,
+) -> None:
     """
     Main build orchestrator.
 
@@ -395,7 +407,7 @@ def build(wasi: bool = False, examples: Optional[List[str]] = None, run_tests: b
         cmake_extra_args.append(f"-DBUILD_EXAMPLES={examples_list}")
 
     # Phase 3: Build
-    run_cmake_build(build_dir, wasi, cmake_extra_args)
+    run_cmake_build(build_dir, wasi, cmake_extra_args, jobs, copy_compile_commands)
 
     # Native: run tests only if requested
     if not wasi and run_tests:
@@ -472,6 +484,20 @@ Examples:
         help="Run tests after native build (ignored for WASM builds)",
     )
 
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=None,
+        help="Parallel compile jobs (default: CPU count)",
+    )
+
+    parser.add_argument(
+        "--no-compile-commands",
+        action="store_false",
+        dest="copy_compile_commands",
+        help="Do not copy compile_commands.json to the repo root",
+    )
+
     args = parser.parse_args()
 
     # If no arguments provided, print help and exit
@@ -484,7 +510,13 @@ Examples:
         sys.exit(0)
 
     try:
-        build(wasi=args.icwasm, examples=args.examples, run_tests=args.run_tests)
+        build(
+            wasi=args.icwasm,
+            examples=args.examples,
+            run_tests=args.run_tests,
+            jobs=args.jobs,
+            copy_compile_commands=args.copy_compile_commands,
+        )
     except subprocess.CalledProcessError as e:
         print(f"\n✗ Build failed: {e}")
         sys.exit(1)
@@ -0,0 +1,61 @@
+"""
+Shared pytest fixtures for the example canister test suites.
+
+The suites are independent PocketIC calls, so they can run under pytest-xdist:
+
+    pytest -n auto --dist=loadgroup examples/records examples/types_example
+
+Each xdist worker installs its own canister; tests that change or read
+canister state carry an xdist_group mark so they stay together, in file
+order, on one worker.
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path for imports
+project_root = Path(__file__).resolve().parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--no-rebuild",
+        action="store_true",
+        default=False,
+        help="Skip build.py for example canisters whose wasm is newer than their sources.",
+    )
+
+
+def pytest_configure(config):
+    # Registered here too so the mark is known when pytest-xdist is absent.
+    config.addinivalue_line(
+        "markers", "xdist_group(name): run these tests on the same xdist worker"
+    )
+
+
+@pytest.fixture(scope="session")
+def example_canister(request):
+    """
+    Session-wide installer: example_canister(name) -> (pic, canister_id).
+
+    Each example is built and installed once per session, however many test
+    modules ask for it.
+    """
+    # Imported lazily so suites that never touch PocketIC (e.g. llm_c unit
+    # tests) do not need pocket_ic installed.
+    from test.support.test_support_pocketic import install_example_canister_cached
+
+    skip_fresh_build = request.config.getoption("--no-rebuild")
+
+    def install(example_name: str):
+        return install_example_canister_cached(
+            example_name, auto_build=True, skip_fresh_build=skip_fresh_build
+        )
+
+    return install
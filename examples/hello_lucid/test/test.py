@@ -8,9 +8,18 @@ import sys
 import os
 from pathlib import Path
 
+# Add project root to path for imports
+project_root = Path(__file__).resolve().parent.parent.parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
 try:
     from pocket_ic import PocketIC
     from ic.candid import encode
+    from test.support.test_support_pocketic import (
+        decode_candid_text,
+        setup_pocketic_binary,
+    )
 except ImportError:
     print("Error: pocket-ic not installed. Install it with: pip3 install pocket-ic")
     print("Or: pip install pocket-ic")
@@ -38,28 +47,6 @@ def find_project_root(start_path: Path) -> Path:
     return current
 
 
-def setup_pocketic_binary():
-    """Set up PocketIC binary path if not already set"""
-    script_dir = Path(__file__).parent.resolve()
-    pocket_ic_bin = script_dir / "pocket-ic"
-
-    if "POCKET_IC_BIN" not in os.environ and pocket_ic_bin.exists():
-        os.environ["POCKET_IC_BIN"] = str(pocket_ic_bin)
-        print(f"Set POCKET_IC_BIN to: {pocket_ic_bin}")
-    elif "POCKET_IC_BIN" not in os.environ:
-        cwd_pocket_ic = Path.cwd() / "pocket-ic"
-        if cwd_pocket_ic.exists():
-            os.environ["POCKET_IC_BIN"] = str(cwd_pocket_ic)
-            print(f"Set POCKET_IC_BIN to: {cwd_pocket_ic}")
-        else:
-            print(
-                f"Warning: pocket-ic binary not found in {script_dir} or {Path.cwd()}"
-            )
-            print(
-                "Please set POCKET_IC_BIN environment variable or place pocket-ic in the test directory"
-            )
-
-
 def get_wasm_path():
     """Get the path to build-wasi/bin/hello_lucid_ic.wasm"""
     script_dir = Path(__file__).parent.resolve()
@@ -104,39 +91,6 @@ def get_did_path():
     return did_path
 
 
-def decode_candid_text(response_bytes: bytes) -> str:
-    """
-    Simple manual decoding for Candid text responses.
-    Extracts printable string from DIDL encoded bytes.
-    """
-    if not isinstance(response_bytes, bytes):
-        return str(response_bytes)
-
-    # Try to find known string pattern or just extract printable chars
-    # This is a naive implementation for test purposes
-    try:
-        # Look for DIDL magic bytes
-        if response_bytes.startswith(b"DIDL"):
-            # Skip header roughly (magic + table) and look for content
-            # Just extraction of ASCII/UTF-8 content for now
-            import re
-
-            text_content = re.search(b"[a-zA-Z0-9_ -]+$", response_bytes)
-            if text_content:
-                return text_content.group(0).decode("utf-8")
-    except Exception:
-        pass
-
-    # Fallback: decode and strip non-printable
-    try:
-        decoded = response_bytes.decode("utf-8", errors="ignore")
-        import string
-
-        return "".join(filter(lambda x: x in string.printable, decoded)).strip()
-    except Exception:
-        return str(response_bytes)
-
-
 def run_test(pic, canister_id, method, expected_substr):
     """Run a query test and verify response contains expected substring."""
     print(f"\n=== Testing {method} ===")
@@ -6,6 +6,7 @@
 
 #include "../model/tokenizer.h"
 #include <string.h>
+#include <unistd.h>
 
 #define GPT2_EOT 50256
 
@@ -119,9 +120,226 @@ static int parse_tokens(const char *token_str, int **out_tokens) {
     return idx;
 }
 
+static uint32_t load_le32(const unsigned char *p) {
+    return (uint32_t)p[0] | ((uint32_t)p[1] << 8) | ((uint32_t)p[2] << 16) |
+           ((uint32_t)p[3] << 24);
+}
+
+static void store_le32(unsigned char *p, uint32_t v) {
+    p[0] = (unsigned char)v;
+    p[1] = (unsigned char)(v >> 8);
+    p[2] = (unsigned char)(v >> 16);
+    p[3] = (unsigned char)(v >> 24);
+}
+
+static int read_tokens_fd(int fd, int **out_tokens) {
+    // fd carries raw little-endian int32 token ids until EOF
+    size_t cap = 256, len = 0;
+    char  *buf = (char *)malloc(cap);
+    if (buf == NULL)
+        return -1;
+    for (;;) {
+        if (len == cap) {
+            char *grown = (char *)realloc(buf, cap * 2);
+            if (grown == NULL) {
+                free(buf);
+                return -1;
+            }
+            buf = grown;
+            cap *= 2;
+        }
+        ssize_t n = read(fd, buf + len, cap - len);
+        if (n < 0) {
+            free(buf);
+            return -1;
+        }
+        if (n == 0)
+            break;
+        len += (size_t)n;
+    }
+    int count = (int)(len / sizeof(int32_t));
+    int *tokens = (int *)malloc(sizeof(int) * (count > 0 ? count : 1));
+    if (tokens == NULL) {
+        free(buf);
+        return -1;
+    }
+    const unsigned char *p = (const unsigned char *)buf;
+    for (int i = 0; i < count; i++, p += 4) {
+        tokens[i] = (int32_t)load_le32(p);
+    }
+    free(buf);
+    *out_tokens = tokens;
+    return count;
+}
+
+// Make sure the activation buffers hold at least T positions. gpt2_forward
+// sizes them on first use and refuses anything longer afterwards, so a
+// resident model drops them and lets the next forward reallocate.
+static void ensure_activations(GPT2 *model, int *sequence, int T) {
+    if (model->acts_memory != NULL && T <= model->seq_len)
+        return;
+    free(model->acts_memory);
+    free(model->inputs);
+    free(model->targets);
+    model->acts_memory = NULL;
+    model->inputs = NULL;
+    model->targets = NULL;
+    gpt2_forward(model, sequence, NULL, 1, T); // allocate buffers up front
+    model->mean_loss = -1.0f;                  // clear loss flag
+}
+
+// Sample up to max_new tokens after the prompt_len tokens already in
+// sequence (which must have room for prompt_len + max_new). Returns the
+// final sequence length.
+static int generate(GPT2 *model, int *sequence, int prompt_len, int max_new,
+                    float temperature, int top_k, float *work_logits,
+                    float *work_probs) {
+    int                vocab = model->config.vocab_size;
+    unsigned long long rng_state = 1337;
+    int                seq_len = prompt_len;
+    for (int gen = 0; gen < max_new; gen++) {
+        gpt2_forward(model, sequence, NULL, 1, seq_len);
+        float *logits = model->acts.logits + (seq_len - 1) * vocab;
+        for (int i = 0; i < vocab; i++) {
+            work_logits[i] = logits[i];
+        }
+        if (temperature > 0.0f) {
+            float inv_temp = 1.0f / temperature;
+            for (int i = 0; i < vocab; i++)
+                work_logits[i] *= inv_temp;
+        }
+        if (top_k > 0)
+            top_k_filter(work_logits, vocab, top_k);
+        softmax_vec(work_logits, work_probs, vocab);
+        float coin = rng_f32(&rng_state);
+        int   next = sample_mult_local(work_probs, vocab, coin);
+        sequence[seq_len++] = next;
+        if (next == GPT2_EOT)
+            break;
+    }
+    return seq_len;
+}
+
+static int read_full(int fd, void *buf, size_t n) {
+    unsigned char *p = (unsigned char *)buf;
+    while (n > 0) {
+        ssize_t got = read(fd, p, n);
+        if (got <= 0)
+            return -1;
+        p += got;
+        n -= (size_t)got;
+    }
+    return 0;
+}
+
+static int write_full(int fd, const void *buf, size_t n) {
+    const unsigned char *p = (const unsigned char *)buf;
+    while (n > 0) {
+        ssize_t put = write(fd, p, n);
+        if (put <= 0)
+            return -1;
+        p += put;
+        n -= (size_t)put;
+    }
+    return 0;
+}
+
+// --server: keep the checkpoint resident and answer requests on stdin/stdout.
+// Every field is little-endian 32-bit.
+//   request:  n_prompt, max_new, top_k, temperature (float), n_prompt tokens
+//   response: n_tokens (-1 on a bad request), n_tokens tokens
+// The full sequence (prompt + generated) is returned, as in one-shot mode.
+// n_prompt == 0 or EOF ends the loop. Log output from the model code is sent
+// to stderr so stdout carries only responses.
+static int run_server(const char *checkpoint_path) {
+#ifdef __wasi__
+    (void)checkpoint_path;
+    fprintf(stderr, "Error: --server is not supported on WASI\n");
+    return 1;
+#else
+    fflush(stdout);
+    int reply_fd = dup(STDOUT_FILENO);
+    if (reply_fd < 0 || dup2(STDERR_FILENO, STDOUT_FILENO) < 0) {
+        fprintf(stderr, "Error: failed to redirect stdout\n");
+        return 1;
+    }
+
+    GPT2 model;
+    gpt2_build_from_checkpoint(&model, (char *)checkpoint_path);
+    int    max_seq = model.config.max_seq_len;
+    int    vocab = model.config.vocab_size;
+    int   *sequence = (int *)malloc(sizeof(int) * max_seq);
+    float *work_logits = (float *)malloc(sizeof(float) * vocab);
+    float *work_probs = (float *)malloc(sizeof(float) * vocab);
+    unsigned char *wire = (unsigned char *)malloc(4 * (size_t)(max_seq + 1));
+    if (sequence == NULL || work_logits == NULL || work_probs == NULL ||
+        wire == NULL) {
+        fprintf(stderr, "Error: memory allocation failed\n");
+        return 1;
+    }
+
+    int rc = 0;
+    for (;;) {
+        unsigned char header[16];
+        if (read_full(STDIN_FILENO, header, sizeof(header)) != 0)
+            break;
+        int      prompt_len = (int32_t)load_le32(header);
+        int      max_new = (int32_t)load_le32(header + 4);
+        int      top_k = (int32_t)load_le32(header + 8);
+        uint32_t temp_bits = load_le32(header + 12);
+        float    temperature;
+        memcpy(&temperature, &temp_bits, sizeof(temperature));
+        if (prompt_len == 0)
+            break;
+        if (prompt_len < 0 || prompt_len > max_seq) {
+            // the prompt cannot be skipped reliably, so stop serving
+            store_le32(wire, (uint32_t)-1);
+            write_full(reply_fd, wire, 4);
+            rc = 1;
+            break;
+        }
+        if (read_full(STDIN_FILENO, wire, 4 * (size_t)prompt_len) != 0) {
+            rc = 1;
+            break;
+        }
+        for (int i = 0; i < prompt_len; i++) {
+            sequence[i] = (int32_t)load_le32(wire + 4 * i);
+        }
+        if (max_new < 0)
+            max_new = 0;
+        if (prompt_len + max_new > max_seq)
+            max_new = max_seq - prompt_len;
+        for (int i = prompt_len; i < prompt_len + max_new; i++) {
+            sequence[i] = sequence[prompt_len - 1];
+        }
+        ensure_activations(&model, sequence, prompt_len + max_new);
+
+        int seq_len = generate(&model, sequence, prompt_len, max_new,
+                               temperature, top_k, work_logits, work_probs);
+        store_le32(wire, (uint32_t)seq_len);
+        for (int i = 0; i < seq_len; i++) {
+            store_le32(wire + 4 * (i + 1), (uint32_t)sequence[i]);
+        }
+        if (write_full(reply_fd, wire, 4 * (size_t)(seq_len + 1)) != 0) {
+            rc = 1;
+            break;
+        }
+    }
+
+    free(wire);
+    free(sequence);
+    free(work_logits);
+    free(work_probs);
+    gpt2_free(&model);
+    close(reply_fd);
+    return rc;
+#endif
+}
+
 static void usage() {
     printf("Usage: ./run_gpt2 [--tokens \"<space separated token ids>\"] "
-           "[--prompt \"text\"] [--decode]\n");
+           "[--tokens-fd FD] [--prompt \"text\"] [--decode]\n");
+    printf("                [--server]\n");
     printf(
         "                [--max-new N] [--temp T] [--top-k K] [--ckpt path]\n");
     printf("                [--vocab path] [--merges path]\n");
@@ -141,10 +359,14 @@ int main(int argc, char **argv) {
         .decode = 0,
     };
     const char *tokens_arg = NULL;
+    int         tokens_fd = -1;
+    int         server = 0;
 
     for (int i = 1; i < argc; i++) {
         if (strcmp(argv[i], "--tokens") == 0 && i + 1 < argc) {
             tokens_arg = argv[++i];
+        } else if (strcmp(argv[i], "--tokens-fd") == 0 && i + 1 < argc) {
+            tokens_fd = atoi(argv[++i]);
         } else if (strcmp(argv[i], "--prompt") == 0 && i + 1 < argc) {
             cfg.prompt = argv[++i];
         } else if (strcmp(argv[i], "--max-new") == 0 && i + 1 < argc) {
@@ -161,14 +383,19 @@ int main(int argc, char **argv) {
             cfg.merges_path = argv[++i];
         } else if (strcmp(argv[i], "--decode") == 0) {
             cfg.decode = 1;
+        } else if (strcmp(argv[i], "--server") == 0) {
+            server = 1;
         } else {
             usage();
             return 1;
         }
     }
 
-    if (tokens_arg == NULL && cfg.prompt == NULL) {
-        printf("Error: --tokens or --prompt is required\n");
+    if (server)
+        return run_server(cfg.checkpoint_path);
+
+    if (tokens_arg == NULL && tokens_fd < 0 && cfg.prompt == NULL) {
+        printf("Error: --tokens, --tokens-fd or --prompt is required\n");
         usage();
         return 1;
     }
@@ -185,6 +412,8 @@ int main(int argc, char **argv) {
     }
     if (cfg.prompt != NULL) {
         tokens = tokenizer_encode(tok, cfg.prompt, &prompt_len);
+    } else if (tokens_fd >= 0) {
+        prompt_len = read_tokens_fd(tokens_fd, &tokens);
     } else {
         prompt_len = parse_tokens(tokens_arg, &tokens);
     }
@@ -210,9 +439,8 @@ int main(int argc, char **argv) {
     memcpy(sequence, tokens, sizeof(int) * prompt_len);
     free(tokens);
 
-    unsigned long long rng_state = 1337;
-    float             *work_logits = (float *)malloc(sizeof(float) * vocab);
-    float             *work_probs = (float *)malloc(sizeof(float) * vocab);
+    float *work_logits = (float *)malloc(sizeof(float) * vocab);
+    float *work_probs = (float *)malloc(sizeof(float) * vocab);
     if (work_logits == NULL || work_probs == NULL || sequence == NULL) {
         printf("Error: memory allocation failed\n");
         if (tok)
@@ -224,31 +452,10 @@ int main(int argc, char **argv) {
     for (int i = prompt_len; i < alloc_len; i++) {
         sequence[i] = sequence[prompt_len - 1];
     }
-    gpt2_forward(&model, sequence, NULL, 1,
-                 alloc_len); // allocate buffers up front
-    model.mean_loss = -1.0f; // clear loss flag
-
-    int seq_len = prompt_len;
-    for (int gen = 0; gen < cfg.max_new_tokens; gen++) {
-        gpt2_forward(&model, sequence, NULL, 1, seq_len);
-        float *logits = model.acts.logits + (seq_len - 1) * vocab;
-        for (int i = 0; i < vocab; i++) {
-            work_logits[i] = logits[i];
-        }
-        if (cfg.temperature > 0.0f) {
-            float inv_temp = 1.0f / cfg.temperature;
-            for (int i = 0; i < vocab; i++)
-                work_logits[i] *= inv_temp;
-        }
-        if (cfg.top_k > 0)
-            top_k_filter(work_logits, vocab, cfg.top_k);
-        softmax_vec(work_logits, work_probs, vocab);
-        float coin = rng_f32(&rng_state);
-        int   next = sample_mult_local(work_probs, vocab, coin);
-        sequence[seq_len++] = next;
-        if (next == GPT2_EOT)
-            break;
-    }
+    ensure_activations(&model, sequence, alloc_len);
+
+    int seq_len = generate(&model, sequence, prompt_len, cfg.max_new_tokens,
+                           cfg.temperature, cfg.top_k, work_logits, work_probs);
 
     printf("Generated token ids:\n");
     for (int i = 0; i < seq_len; i++) {
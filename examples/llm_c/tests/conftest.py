@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 import pathlib
 import sys
 from typing import Generator
@@ -14,6 +15,23 @@ REPO_ROOT = SCRIPT_DIR.parents[1]
 sys.path.insert(0, str(SCRIPT_DIR))
 sys.path.insert(0, str(REPO_ROOT))
 
+PROXY_ENV_VARS = (
+    "HTTP_PROXY",
+    "http_proxy",
+    "HTTPS_PROXY",
+    "https_proxy",
+    "ALL_PROXY",
+    "all_proxy",
+)
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _no_proxies() -> Generator[None, None, None]:
+    """Unset proxies once so they cannot interfere with local replica calls."""
+    for proxy_var in PROXY_ENV_VARS:
+        os.environ.pop(proxy_var, None)
+    yield
+
 
 @pytest.fixture
 def example_dir() -> pathlib.Path:
@@ -43,3 +61,11 @@ def checkpoint_path(example_dir: pathlib.Path) -> pathlib.Path | None:
     if checkpoint.exists():
         return checkpoint
     return None
+
+
+@pytest.fixture(scope="session")
+def gguf_model() -> pathlib.Path:
+    """Return the tiny-gpt2 GGUF model path, verified (or downloaded) once per session."""
+    from tests.utils.gguf_helper import get_model_fixture
+
+    return get_model_fixture()
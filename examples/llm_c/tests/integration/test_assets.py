@@ -29,17 +29,13 @@ pytestmark = pytest.mark.skipif(
 )
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def agent_and_canister():
     """Setup agent and canister ID."""
     from ic.agent import Agent
     from ic.client import Client
     from ic.identity import Identity
 
-    # Unset proxies
-    for proxy_var in ("HTTP_PROXY", "http_proxy", "HTTPS_PROXY", "https_proxy", "ALL_PROXY", "all_proxy"):
-        os.environ.pop(proxy_var, None)
-
     wait_for_replica()
     canister_id = query_canister_id()
     identity = Identity()
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import os
 import pathlib
 import subprocess
@@ -15,6 +16,8 @@ SCRIPT_DIR = pathlib.Path(__file__).parent.parent.parent
 REPO_ROOT = SCRIPT_DIR.parents[1]
 sys.path.insert(0, str(SCRIPT_DIR))
 
+from tests.utils.replica import DFX, tcp_alive
+
 # These tests require dfx and a running replica
 pytestmark = pytest.mark.skipif(
     not os.environ.get("LLM_TEST_ENABLE_INTEGRATION"),
@@ -22,30 +25,40 @@ pytestmark = pytest.mark.skipif(
 )
 
 
+_replica_ready = False
+
+
 def wait_for_replica(max_attempts: int = 20, delay_s: float = 1.0) -> None:
     """Wait for the local replica to accept requests."""
+    global _replica_ready
+    if _replica_ready:
+        return
     for attempt in range(1, max_attempts + 1):
         try:
-            subprocess.run(
-                ["dfx", "ping"],
-                cwd=SCRIPT_DIR,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                check=True,
-            )
-            return
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            if attempt < max_attempts:
-                time.sleep(delay_s)
-            else:
-                pytest.skip("dfx replica not available")
-
-
+            if tcp_alive():
+                subprocess.run(
+                    [DFX, "ping"],
+                    cwd=SCRIPT_DIR,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    check=True,
+                    timeout=30,
+                )
+                _replica_ready = True
+                return
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired, FileNotFoundError):
+            pass
+        if attempt < max_attempts:
+            time.sleep(delay_s)
+    pytest.skip("dfx replica not available")
+
+
+@functools.lru_cache(maxsize=1)
 def query_canister_id() -> str:
-    """Read the local deployment's canister id for llm_c."""
+    """Read the local deployment's canister id for llm_c (cached per session)."""
     try:
         result = subprocess.run(
-            ["dfx", "canister", "id", "llm_c"],
+            [DFX, "canister", "id", "llm_c"],
             cwd=SCRIPT_DIR,
             capture_output=True,
             text=True,
@@ -70,10 +83,6 @@ def test_hello_query(canister_id: str):
     from ic.identity import Identity
     from ic.candid import encode, Types
 
-    # Unset proxies
-    for proxy_var in ("HTTP_PROXY", "http_proxy", "HTTPS_PROXY", "https_proxy", "ALL_PROXY", "all_proxy"):
-        os.environ.pop(proxy_var, None)
-
     identity = Identity()
     client = Client(url=os.environ.get("LLM_TEST_REPLICA", "http://127.0.0.1:4943"))
     agent = Agent(identity, client)
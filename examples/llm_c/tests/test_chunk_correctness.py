@@ -1,9 +1,12 @@
 #!/usr/bin/env python3
 """Test chunk upload and stable memory load correctness."""
 
+import logging
 import os
 import sys
 import pathlib
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 
 # Clear proxy env vars
 for key in list(os.environ.keys()):
@@ -19,44 +22,60 @@ from test_llm_c import (
     asset_exists,
     checkpoint_complete,
 )
+from utils.candid_blob import encode_text_blob
 from utils.chunk_utils import DEFAULT_CHUNK_SIZE
+from utils.fixtures import create_test_file
 from ic.agent import Agent
 from ic.client import Client
 from ic.identity import Identity
-from ic.candid import encode, Types
 
+# Per-chunk progress is only emitted with LLM_TEST_VERBOSE=1 so stdout writes
+# stay off the upload loop.
+log = logging.getLogger(__name__)
+if os.environ.get("LLM_TEST_VERBOSE"):
+    log.setLevel(logging.DEBUG)
+    log.addHandler(logging.StreamHandler(sys.stdout))
 
-def create_test_file(size: int) -> bytes:
-    """Create test data with known pattern."""
-    # Create repeating pattern so we can verify integrity
-    pattern = b"TEST_DATA_PATTERN_" + str(size).encode() + b"_"
-    data = (pattern * (size // len(pattern) + 1))[:size]
-    return data
+# load_asset appends contiguously, so chunks must be submitted in order; the
+# window only lets the next chunks be encoded while the current call is in flight.
+UPLOAD_WINDOW = 2
+
+
+def encode_chunk_args(name: str, chunk: bytes) -> bytes:
+    """Encode the (text, blob) arguments for a single load_asset call."""
+    return encode_text_blob(name, chunk)
 
 
 def upload_test_asset(agent: Agent, canister_id: str, name: str, data: bytes):
     """Upload test asset in chunks."""
     chunk_size = DEFAULT_CHUNK_SIZE
     total_size = len(data)
-    offset = 0
+    offsets = iter(range(0, total_size, chunk_size))
     chunk_num = 0
     
     print(f"\nUploading '{name}' ({total_size:,} bytes, {(total_size + chunk_size - 1) // chunk_size} chunks)")
     
-    while offset < total_size:
-        chunk = data[offset:offset + chunk_size]
-        actual_size = len(chunk)
-        
-        args = [
-            {"type": Types.Text, "value": name},
-            {"type": Types.Vec(Types.Nat8), "value": list(chunk)}
-        ]
-        
-        print(f"  Chunk {chunk_num}: offset={offset:,}, size={actual_size:,}")
-        agent.update_raw(canister_id, "load_asset", encode(args))
-        
-        offset += actual_size
-        chunk_num += 1
+    with ThreadPoolExecutor(max_workers=UPLOAD_WINDOW) as pool:
+        window: deque[tuple[int, int, Future[bytes]]] = deque()
+
+        def submit_next() -> None:
+            offset = next(offsets, None)
+            if offset is None:
+                return
+            chunk = data[offset:offset + chunk_size]
+            window.append((offset, len(chunk), pool.submit(encode_chunk_args, name, chunk)))
+
+        for _ in range(UPLOAD_WINDOW):
+            submit_next()
+
+        while window:
+            offset, actual_size, encoded = window.popleft()
+            payload = encoded.result()
+            submit_next()
+
+            log.debug("  Chunk %d: offset=%d, size=%d", chunk_num, offset, actual_size)
+            agent.update_raw(canister_id, "load_asset", payload)
+            chunk_num += 1
     
     print(f"  ✓ Upload complete: {chunk_num} chunks")
 
@@ -9,12 +9,18 @@ Supports two replica modes:
 from __future__ import annotations
 
 import argparse
+import atexit
+import functools
+import mmap
 import os
 import pathlib
+import queue
+import struct
 import subprocess
 import sys
+import threading
 import time
-from typing import Any, Callable
+from typing import Any, Callable, Iterator
 
 from ic.agent import Agent
 from ic.client import Client
@@ -28,14 +34,65 @@ REPO_ROOT = SCRIPT_DIR.parents[1]
 sys.path.insert(0, str(SCRIPT_DIR / "tests"))
 sys.path.insert(0, str(REPO_ROOT))
 
+from utils.candid_blob import encode_text_blob
 from utils.chunk_utils import DEFAULT_CHUNK_SIZE, chunk_sizes
+from utils.replica import DFX, tcp_alive
+
+
+# Candid types and constant payloads, built once instead of on every call.
+_NAT32 = Types.Nat32
+_TEXT = Types.Text
+_TEXT_RETURN = [Types.Text]
+_NAT64_RETURN = [Types.Nat64]
+_EMPTY_ARGS = encode([])
+
+
+@functools.lru_cache(maxsize=16)
+def _encode_text_arg(value: str) -> bytes:
+    """Encode a single ``(text)`` argument tuple (memoized per value)."""
+    return encode([{"type": _TEXT, "value": value}])
+
+
+@functools.lru_cache(maxsize=16)
+def _encode_nat32_args(*values: int) -> bytes:
+    """Encode a tuple of ``nat32`` arguments (memoized per value tuple)."""
+    return encode([{"type": _NAT32, "value": value} for value in values])
+
+
+# Keep-alive client behind ic.client's httpx calls (see configure_httpx_timeout).
+_shared_httpx_client: Any = None
 
 
 def configure_httpx_timeout(timeout_s: float) -> None:
-    """Force a longer timeout for httpx calls used by ic.client."""
+    """Force a longer timeout for httpx calls used by ic.client.
+
+    Calls are routed through one shared keep-alive ``httpx.Client`` instead
+    of the module-level ``httpx.post``/``get``, which open a new connection
+    per request. HTTP/2 is enabled when the optional ``h2`` package exists.
+    The client is created once, reused by later calls and closed at exit.
+    """
+    global _shared_httpx_client
     import ic.client as ic_client
     import httpx
 
+    shared = _shared_httpx_client
+    if shared is None:
+        try:
+            import h2  # noqa: F401
+            http2 = True
+        except ImportError:
+            http2 = False
+
+        shared = httpx.Client(
+            http2=http2,
+            timeout=timeout_s,
+            limits=httpx.Limits(max_connections=16, max_keepalive_connections=16),
+        )
+        atexit.register(shared.close)
+        _shared_httpx_client = shared
+    else:
+        shared.timeout = httpx.Timeout(timeout_s)
+
     def wrap(fn: Callable[..., httpx.Response]) -> Callable[..., httpx.Response]:
         def inner(*args: Any, **kwargs: Any) -> httpx.Response:
             kwargs.setdefault("timeout", timeout_s)
@@ -43,8 +100,8 @@ def configure_httpx_timeout(timeout_s: float) -> None:
 
         return inner
 
-    ic_client.httpx.post = wrap(httpx.post)
-    ic_client.httpx.get = wrap(httpx.get)
+    ic_client.httpx.post = wrap(shared.post)
+    ic_client.httpx.get = wrap(shared.get)
 
 
 def run_build() -> None:
@@ -61,16 +118,17 @@ def deploy_canister() -> None:
     """Deploy the freshly built canister via dfx."""
     print("Deploying the llm_c canister...")
     subprocess.run(
-        ["dfx", "deploy", "llm_c", "--no-wallet"],
+        [DFX, "deploy", "llm_c", "--no-wallet"],
         check=True,
         cwd=SCRIPT_DIR,
     )
 
 
+@functools.lru_cache(maxsize=1)
 def query_canister_id() -> str:
-    """Read the local deployment's canister id for llm_c."""
+    """Read the local deployment's canister id for llm_c (cached per process)."""
     result = subprocess.run(
-        ["dfx", "canister", "id", "llm_c"],
+        [DFX, "canister", "id", "llm_c"],
         cwd=SCRIPT_DIR,
         capture_output=True,
         text=True,
@@ -79,78 +137,181 @@ def query_canister_id() -> str:
     return result.stdout.strip()
 
 
+_replica_ready = False
+
+
 def wait_for_replica(max_attempts: int = 20, delay_s: float = 1.0) -> None:
-    """Wait for the local replica to accept requests."""
+    """Wait for the local replica to accept requests.
+
+    Polls with a TCP connect to the replica port and only runs `dfx ping`
+    (a full process spawn) once the port accepts connections.
+    """
+    global _replica_ready
+    if _replica_ready:
+        return
     for attempt in range(1, max_attempts + 1):
         try:
-            subprocess.run(
-                ["dfx", "ping"],
-                cwd=SCRIPT_DIR,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                check=True,
-            )
-            return
-        except subprocess.CalledProcessError:
-            print(f"Replica not ready (attempt {attempt}/{max_attempts})")
-            time.sleep(delay_s)
+            if tcp_alive():
+                subprocess.run(
+                    [DFX, "ping"],
+                    cwd=SCRIPT_DIR,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    check=True,
+                    timeout=30,
+                )
+                _replica_ready = True
+                return
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired):
+            pass
+        print(f"Replica not ready (attempt {attempt}/{max_attempts})")
+        time.sleep(delay_s)
     raise RuntimeError("Replica did not become ready in time")
 
-# TODO query icp doc for how to load binary data to canister. maybe just diff of how canister parse did data.
-# cause its input is just raw binary data before candid parse it .
-# so tell candid dont encode it and dont decode it.
+# load_asset is declared `(text, blob)`; blob is wire-identical to vec nat8, and
+# ic-py has no blob fast path, so chunks are framed directly (utils/candid_blob).
 # keep update payload under 2MiB ingress limit (leave generous headroom)
 CHUNK_SIZE = 1_900_000
+# Chunks read + Candid-encoded ahead of the update call currently in flight.
+DEFAULT_UPLOAD_PREFETCH = 2
+# Upload progress is printed every N chunks (~30MB) rather than per call.
+PROGRESS_EVERY_CHUNKS = 16
+
+
+def _encode_chunk(name: str, chunk: bytes | memoryview) -> bytes:
+    """Encode the (text, blob) arguments of one load_asset call.
+
+    Framed directly from the raw bytes: going through ic-py would need
+    ``list(chunk)``, i.e. one Python int per byte of a ~1.9MB chunk.
+    """
+    return encode_text_blob(name, chunk)
+
+
+def _open_sequential(path: pathlib.Path):
+    """Open ``path`` for one front-to-back pass with a chunk-sized buffer.
+
+    Where available, the kernel is told the access is sequential and asked
+    to start readahead now. The POSIX_FADV_* values are advice codes, not
+    bit flags, so they are issued as separate calls.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    if hasattr(os, "posix_fadvise"):
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass  # advisory only
+    try:
+        return os.fdopen(fd, "rb", buffering=CHUNK_SIZE)
+    except BaseException:
+        os.close(fd)
+        raise
 
 
-def load_asset(client, canister_id, name: str, path: pathlib.Path) -> None:
+def _iter_chunks(path: pathlib.Path) -> Iterator[bytes | memoryview]:
+    """Yield ``path`` in CHUNK_SIZE pieces.
+
+    Files of at least one chunk are memory-mapped and yielded as memoryview
+    slices, so the only copy is the one into the Candid payload. Each slice
+    is released when the consumer asks for the next one.
+    """
+    size = path.stat().st_size
+    with _open_sequential(path) as asset_file:
+        if size < CHUNK_SIZE:
+            while chunk := asset_file.read(CHUNK_SIZE):
+                yield chunk
+            return
+        with mmap.mmap(asset_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if hasattr(mapped, "madvise"):
+                mapped.madvise(mmap.MADV_SEQUENTIAL)
+            with memoryview(mapped) as view:
+                for offset in range(0, size, CHUNK_SIZE):
+                    with view[offset:offset + CHUNK_SIZE] as chunk:
+                        yield chunk
+
+
+def load_asset(
+    client,
+    canister_id,
+    name: str,
+    path: pathlib.Path,
+    prefetch: int = DEFAULT_UPLOAD_PREFETCH,
+) -> None:
     """Load a single asset file into stable memory via the canister API.
+
+    The canister appends every chunk contiguously (out-of-order writes trap),
+    so update calls are issued strictly in order. A reader thread reads and
+    encodes the following chunks into a bounded queue while the current call
+    is in flight, so disk I/O overlaps the network round-trip.
     
     Args:
         client: Agent or PocketIC instance
         canister_id: str or Principal
         name: Asset name
         path: Path to asset file
+        prefetch: Number of chunks read and encoded ahead of the in-flight call
     """
     if not path.exists():
         raise FileNotFoundError(f"{path} does not exist")
     print(f"Loading asset {name} from {path}...")
+    canister = bind_canister(client, canister_id)
     chunk_index = 0
     total_bytes = 0
-    with path.open("rb") as asset_file:
+    prepared: queue.Queue = queue.Queue(maxsize=max(1, prefetch))
+    stop = threading.Event()
+
+    def put(item) -> None:
+        # Poll so the reader exits promptly if the sender gives up.
+        while not stop.is_set():
+            try:
+                prepared.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def reader() -> None:
+        try:
+            for chunk in _iter_chunks(path):
+                if stop.is_set():
+                    break
+                put((len(chunk), _encode_chunk(name, chunk)))
+        except Exception as exc:  # re-raised on the sending thread
+            put(exc)
+            return
+        put(None)
+
+    reader_thread = threading.Thread(target=reader, name=f"load_asset-{name}", daemon=True)
+    reader_thread.start()
+    try:
         while True:
-            chunk = asset_file.read(CHUNK_SIZE)
-            if not chunk:
+            item = prepared.get()
+            if item is None:
                 break
+            if isinstance(item, Exception):
+                raise item
+            chunk_len, payload = item
             chunk_index += 1
-            args = [
-                {"type": Types.Text, "value": name},
-                {"type": Types.Vec(Types.Nat8), "value": list(chunk)},
-            ]
-            
-            # Support both Agent and PocketIC
-            if hasattr(client, 'update_call'):
-                # PocketIC
-                cid = canister_id if isinstance(canister_id, Principal) else Principal.from_str(canister_id)
-                client.update_call(cid, "load_asset", encode(args))
-            else:
-                # Agent
-                client.update_raw(canister_id, "load_asset", encode(args))
-            
-            total_bytes += len(chunk)
-            print(f"...{name}: sent chunk {chunk_index} ({len(chunk)} bytes)")
+            canister.update("load_asset", payload)
+            total_bytes += chunk_len
+            if chunk_index % PROGRESS_EVERY_CHUNKS == 0:
+                print(f"...{name}: sent {chunk_index} chunks ({total_bytes} bytes)")
+    finally:
+        stop.set()
+        reader_thread.join()
     print(f"...{name} loaded ({total_bytes} bytes in {chunk_index} chunks)")
 
 
+# llm.c checkpoint header: little-endian uint32 magic, uint32 version.
+_CHECKPOINT_HEADER = struct.Struct("<II")
+
+
 def is_valid_checkpoint(path: pathlib.Path) -> bool:
     try:
         with path.open("rb") as f:
             header = f.read(8)
         if len(header) < 8:
             return False
-        magic, version = int.from_bytes(header[:4], "little"), int.from_bytes(
-            header[4:], "little"
-        )
+        magic, version = _CHECKPOINT_HEADER.unpack_from(header)
         return magic == 20240326 and version == 1
     except OSError:
         return False
@@ -193,55 +354,108 @@ def pick_checkpoint_path(checkpoint: pathlib.Path | None) -> pathlib.Path:
     )
 
 
-def asset_exists(client, canister_id, name: str) -> bool:
-    encoded_args = encode([{"type": Types.Text, "value": name}])
-    
-    if hasattr(client, 'query_call'):
-        # PocketIC
-        cid = canister_id if isinstance(canister_id, Principal) else Principal.from_str(canister_id)
-        result = client.query_call(cid, "asset_exists", encoded_args)
-        decoded = decode(result)
-        if decoded and len(decoded) > 0:
-            return int(decoded[0]['value']) != 0
-    else:
-        # Agent
-        result = client.query_raw(
-            canister_id, "asset_exists", encoded_args, return_type=[Types.Nat64]
-        )
+# Reply framing of a single `nat` value: no type table, one arg of type nat (-3).
+_NAT_REPLY_PREFIX = b"DIDL\x00\x01\x7d"
+
+
+def _decode_nat_flag(raw: bytes) -> bool:
+    """Return whether a ``(nat)`` reply is non-zero without a full Candid decode.
+
+    The payload after the fixed prefix is the LEB128 value, which is zero
+    exactly when none of its bytes carry value bits.
+    """
+    if raw.startswith(_NAT_REPLY_PREFIX):
+        return any(byte & 0x7F for byte in raw[len(_NAT_REPLY_PREFIX):])
+    decoded = decode(raw)
+    return bool(decoded) and int(decoded[0]['value']) != 0
+
+
+def _first_value(decoded) -> Any:
+    """Return the first decoded value of a PocketIC reply, or None if empty."""
+    if decoded and len(decoded) > 0:
+        return decoded[0]['value']
+    return None
+
+
+class PocketICCanister:
+    """One canister on a PocketIC instance, with its Principal parsed once."""
+
+    def __init__(self, pic, canister_id) -> None:
+        self.canister_id = canister_id if isinstance(canister_id, Principal) else Principal.from_str(canister_id)
+        self._update = functools.partial(pic.update_call, self.canister_id)
+        self._query = functools.partial(pic.query_call, self.canister_id)
+
+    def update(self, method: str, args: bytes) -> None:
+        self._update(method, args)
+
+    def update_text(self, method: str, args: bytes) -> str | None:
+        return _first_value(decode(self._update(method, args)))
+
+    def query_text(self, method: str, args: bytes) -> str | None:
+        return _first_value(decode(self._query(method, args)))
+
+    def query_flag(self, method: str, args: bytes) -> bool:
+        return _decode_nat_flag(self._query(method, args))
+
+
+class AgentCanister:
+    """One canister reached through an ic-py Agent."""
+
+    def __init__(self, agent: Agent, canister_id) -> None:
+        self.canister_id = canister_id
+        self._agent = agent
+
+    def update(self, method: str, args: bytes) -> None:
+        self._agent.update_raw(self.canister_id, method, args)
+
+    def update_text(self, method: str, args: bytes) -> str | None:
+        result = self._agent.update_raw(self.canister_id, method, args, return_type=_TEXT_RETURN)
         if isinstance(result, list) and result:
-            value = result[0].get("value") if isinstance(result[0], dict) else result[0]
-            return int(value) != 0
-    return False
+            return result[0]
+        return None
 
+    def query_text(self, method: str, args: bytes) -> str | None:
+        result = self._agent.query_raw(self.canister_id, method, args, return_type=_TEXT_RETURN)
+        if isinstance(result, list) and result:
+            return result[0]
+        return None
 
-def checkpoint_complete(client, canister_id) -> bool:
-    if hasattr(client, 'query_call'):
-        # PocketIC
-        cid = canister_id if isinstance(canister_id, Principal) else Principal.from_str(canister_id)
-        result = client.query_call(cid, "checkpoint_complete", encode([]))
-        decoded = decode(result)
-        if decoded and len(decoded) > 0:
-            return int(decoded[0]['value']) != 0
-    else:
-        # Agent
-        result = client.query_raw(
-            canister_id,
-            "checkpoint_complete",
-            encode([]),
-            return_type=[Types.Nat64],
-        )
+    def query_flag(self, method: str, args: bytes) -> bool:
+        result = self._agent.query_raw(self.canister_id, method, args, return_type=_NAT64_RETURN)
         if isinstance(result, list) and result:
             value = result[0].get("value") if isinstance(result[0], dict) else result[0]
             return int(value) != 0
-    return False
+        return False
+
+
+def bind_canister(client, canister_id=None) -> PocketICCanister | AgentCanister:
+    """Bind ``client`` (PocketIC or Agent) to ``canister_id``.
+
+    Already-bound canisters are returned unchanged, so helpers accept either
+    a raw client plus id or the result of an earlier ``bind_canister`` call.
+    """
+    if isinstance(client, (PocketICCanister, AgentCanister)):
+        return client
+    if hasattr(client, 'update_call'):
+        return PocketICCanister(client, canister_id)
+    return AgentCanister(client, canister_id)
+
+
+def asset_exists(client, canister_id, name: str) -> bool:
+    return bind_canister(client, canister_id).query_flag("asset_exists", _encode_text_arg(name))
+
+
+def checkpoint_complete(client, canister_id) -> bool:
+    return bind_canister(client, canister_id).query_flag("checkpoint_complete", _EMPTY_ARGS)
 
 
 def verify_asset_complete(client, canister_id, name: str) -> bool:
     """Verify that an asset exists and is complete (for checkpoint, also check completeness)."""
-    if not asset_exists(client, canister_id, name):
+    canister = bind_canister(client, canister_id)
+    if not asset_exists(canister, None, name):
         return False
     if name == "checkpoint":
-        return checkpoint_complete(client, canister_id)
+        return checkpoint_complete(canister, None)
     return True
 
 
@@ -252,6 +466,7 @@ def upload_assets(
     gguf: pathlib.Path | None,
     stories: pathlib.Path | None,
     skip_existing: bool,
+    prefetch: int = DEFAULT_UPLOAD_PREFETCH,
 ) -> None:
     """Upload the checkpoint/gguf, vocab and merge files required for inference.
     
@@ -262,6 +477,7 @@ def upload_assets(
         gguf: Optional gguf model path
         stories: Optional stories asset path
         skip_existing: If True, skip upload if asset exists and is complete
+        prefetch: Chunks prepared ahead of each in-flight load_asset call
     """
     assets = []
     if gguf is not None:
@@ -274,22 +490,17 @@ def upload_assets(
     assets.append(("merges", SCRIPT_DIR / "assets" / "vocab.bpe"))
     if stories:
         assets.append(("stories", stories))
+    canister = bind_canister(client, canister_id)
     for name, path in assets:
-        if skip_existing and verify_asset_complete(client, canister_id, name):
+        if skip_existing and verify_asset_complete(canister, None, name):
             print(f"Skipping asset {name}; already present and complete")
             continue
-        load_asset(client, canister_id, name, path)
+        load_asset(canister, None, name, path, prefetch)
 
 
 def reset_assets(client, canister_id) -> None:
     """Clear any previous asset table state to ensure contiguous uploads."""
-    if hasattr(client, 'update_call'):
-        # PocketIC
-        cid = canister_id if isinstance(canister_id, Principal) else Principal.from_str(canister_id)
-        client.update_call(cid, "reset_assets", encode([]))
-    else:
-        # Agent
-        client.update_raw(canister_id, "reset_assets", encode([]))
+    bind_canister(client, canister_id).update("reset_assets", _EMPTY_ARGS)
 
 
 def call_infer(
@@ -302,74 +513,34 @@ def call_infer(
     use_step: bool,
 ) -> str:
     """Call the `infer_hello_update` update and return its textual response."""
-    
+    canister = bind_canister(client, canister_id)
+
     def _call_update(method: str, args):
-        """Helper to call update methods on either Agent or PocketIC."""
-        if hasattr(client, 'update_call'):
-            # PocketIC
-            cid = canister_id if isinstance(canister_id, Principal) else Principal.from_str(canister_id)
-            result = client.update_call(cid, method, args)
-            decoded = decode(result)
-            if decoded and len(decoded) > 0:
-                return decoded[0]['value']
-            return ""
-        else:
-            # Agent
-            result = client.update_raw(canister_id, method, args, return_type=[Types.Text])
-            if isinstance(result, list) and result:
-                return result[0]
-            return ""
+        return canister.update_text(method, args) or ""
     
     if use_stories:
         if use_step:
-            init_args = encode(
-                [
-                    {"type": Types.Nat32, "value": stories_offset},
-                    {"type": Types.Nat32, "value": stories_length},
-                    {"type": Types.Nat32, "value": max_new or 0},
-                ]
-            )
+            init_args = _encode_nat32_args(stories_offset, stories_length, max_new or 0)
             print("Calling infer_stories_step_init...")
             _call_update("infer_stories_step_init", init_args)
             
-            step_args = encode([{"type": Types.Nat32, "value": 1}])
+            step_args = _encode_nat32_args(1)
             print("Calling infer_stories_step...")
             _call_update("infer_stories_step", step_args)
             print("Calling infer_stories_step_get...")
-            if hasattr(client, 'query_call'):
-                cid = canister_id if isinstance(canister_id, Principal) else Principal.from_str(canister_id)
-                result = client.query_call(cid, "infer_stories_step_get", encode([]))
-                decoded = decode(result)
-                if decoded and len(decoded) > 0:
-                    return decoded[0]['value']
-                return ""
-            result = client.query_raw(
-                canister_id,
-                "infer_stories_step_get",
-                encode([]),
-                return_type=[Types.Text],
-            )
-            if isinstance(result, list) and result:
-                return result[0]
-            return ""
+            return canister.query_text("infer_stories_step_get", _EMPTY_ARGS) or ""
         if max_new == 1 and stories_offset == 0 and stories_length == 64:
             method = "infer_stories_update"
-            encoded_args = encode([])
+            encoded_args = _EMPTY_ARGS
         else:
             method = "infer_stories_update_limited"
-            encoded_args = encode(
-                [
-                    {"type": Types.Nat32, "value": stories_offset},
-                    {"type": Types.Nat32, "value": stories_length},
-                    {"type": Types.Nat32, "value": max_new or 0},
-                ]
-            )
+            encoded_args = _encode_nat32_args(stories_offset, stories_length, max_new or 0)
     elif max_new is None:
         method = "infer_hello_update"
-        encoded_args = encode([])
+        encoded_args = _EMPTY_ARGS
     else:
         method = "infer_hello_update_limited"
-        encoded_args = encode([{"type": Types.Nat32, "value": max_new}])
+        encoded_args = _encode_nat32_args(max_new)
     
     print(f"Calling {method}...")
     return _call_update(method, encoded_args)
@@ -378,24 +549,10 @@ def call_infer(
 def verify_assets_loaded(client, canister_id) -> bool:
     """Call the `assets_loaded` query to confirm the canister sees the uploads."""
     print("Verifying assets_loaded query...")
-    encoded_args = encode([])
-    
-    if hasattr(client, 'query_call'):
-        # PocketIC
-        cid = canister_id if isinstance(canister_id, Principal) else Principal.from_str(canister_id)
-        result = client.query_call(cid, "assets_loaded", encoded_args)
-        decoded = decode(result)
-        if decoded and len(decoded) > 0:
-            print("assets_loaded ->", decoded[0]['value'])
-            return True
-    else:
-        # Agent
-        result = client.query_raw(
-            canister_id, "assets_loaded", encoded_args, return_type=[Types.Text]
-        )
-        if isinstance(result, list) and result:
-            print("assets_loaded ->", result[0])
-            return True
+    loaded = bind_canister(client, canister_id).query_text("assets_loaded", _EMPTY_ARGS)
+    if loaded is not None:
+        print("assets_loaded ->", loaded)
+        return True
     
     print("assets_loaded replied with empty payload")
     return False
@@ -405,26 +562,11 @@ def ping_hello(client, canister_id) -> None:
     """Attempt a quick infer_hello query and log the outcome before full testing."""
     print("Querying hello once before asset upload...")
     try:
-        encoded_args = encode([])
-        
-        if hasattr(client, 'query_call'):
-            # PocketIC
-            cid = canister_id if isinstance(canister_id, Principal) else Principal.from_str(canister_id)
-            result = client.query_call(cid, "hello", encoded_args)
-            decoded = decode(result)
-            if decoded and len(decoded) > 0:
-                print("hello probe ->", decoded[0]['value'])
-            else:
-                print("hello probe returned nothing")
+        reply = bind_canister(client, canister_id).query_text("hello", _EMPTY_ARGS)
+        if reply is not None:
+            print("hello probe ->", reply)
         else:
-            # Agent
-            result = client.query_raw(
-                canister_id, "hello", encoded_args, return_type=[Types.Text]
-            )
-            if isinstance(result, list) and result:
-                print("hello probe ->", result[0])
-            else:
-                print("hello probe returned nothing")
+            print("hello probe returned nothing")
     except Exception as exc:  # pragma: no cover - best effort probe
         print("hello probe failed:", exc)
 
@@ -540,6 +682,13 @@ def main() -> None:
         action="store_true",
         help="Disable GGUF upload even if the file exists",
     )
+    parser.add_argument(
+        "--upload-prefetch",
+        "-up",
+        type=int,
+        default=DEFAULT_UPLOAD_PREFETCH,
+        help="Asset chunks read and encoded ahead of the in-flight upload call; uploads stay serial (default: %(default)s)",
+    )
     parser.add_argument(
         "--http-timeout",
         "-ht",
@@ -595,8 +744,13 @@ def main() -> None:
         client_obj = Client(url=args.replica_url)
         client = Agent(identity, client_obj)
     
-    # Common test flow for both modes
-    ping_hello(client, canister_id)
+    # Common test flow for both modes: bind the client to the canister once.
+    client = bind_canister(client, canister_id)
+    canister_id = client.canister_id
+    # The first call pays connection setup (and, for an Agent, status/key
+    # fetches); overlap it with the local path checks below.
+    warmup = threading.Thread(target=ping_hello, args=(client, canister_id), name="ping_hello")
+    warmup.start()
     
     checkpoint_path = resolve_path(args.checkpoint)
     gguf_path = None
@@ -616,6 +770,8 @@ def main() -> None:
                 f"{checkpoint_path} is not a valid checkpoint"
             )
     
+    warmup.join()
+
     # Handle asset upload
     if args.skip_upload:
         print("Skipping asset upload (--skip-upload specified)")
@@ -664,6 +820,7 @@ def main() -> None:
                 gguf_path,
                 stories_path,
                 skip_existing=not reset_now,
+                prefetch=args.upload_prefetch,
             )
             verify_assets_loaded(client, canister_id)
         else:
@@ -5,6 +5,10 @@ import os
 import sys
 import pathlib
 import argparse
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
 
 # Clear proxy env vars
 for key in list(os.environ.keys()):
@@ -14,7 +18,10 @@ for key in list(os.environ.keys()):
 sys.path.insert(0, str(pathlib.Path(__file__).parent))
 sys.path.insert(0, str(pathlib.Path(__file__).parent.parent.parent.parent))
 
+from utils.candid_blob import decode_blob_reply, encode_text_blob
 from utils.chunk_utils import DEFAULT_CHUNK_SIZE
+from utils.djb2 import djb2
+from utils.fixtures import create_test_file
 from ic.agent import Agent
 from ic.client import Client
 from ic.identity import Identity
@@ -24,17 +31,17 @@ from ic.principal import Principal
 
 def compute_local_hash(data: bytes) -> int:
     """Compute DJB2 hash locally to match canister implementation."""
-    hash_val = 5381
-    for byte in data:
-        hash_val = ((hash_val << 5) + hash_val + byte) & 0xFFFFFFFF  # hash * 33 + c, keep 32-bit
-    return hash_val
+    return djb2(data)
+
 
+@functools.lru_cache(maxsize=8)
+def _parse_principal(canister_id: str) -> Principal:
+    return Principal.from_str(canister_id)
 
-def create_test_file(size: int) -> bytes:
-    """Create test data with known pattern."""
-    pattern = b"TEST_DATA_PATTERN_" + str(size).encode() + b"_"
-    data = (pattern * (size // len(pattern) + 1))[:size]
-    return data
+
+def _as_principal(canister_id) -> Principal:
+    """Return canister_id as a Principal, parsing each distinct string only once."""
+    return canister_id if isinstance(canister_id, Principal) else _parse_principal(canister_id)
 
 
 def upload_test_asset(client, canister_id: str, name: str, data: bytes):
@@ -45,23 +52,20 @@ def upload_test_asset(client, canister_id: str, name: str, data: bytes):
     chunk_num = 0
     
     print(f"\nUploading '{name}' ({total_size:,} bytes)")
+    cid = _as_principal(canister_id) if hasattr(client, 'update_call') else canister_id
     
     while offset < total_size:
         chunk = data[offset:offset + chunk_size]
         actual_size = len(chunk)
         
-        args = [
-            {"type": Types.Text, "value": name},
-            {"type": Types.Vec(Types.Nat8), "value": list(chunk)}
-        ]
+        payload = encode_text_blob(name, chunk)
         
         if hasattr(client, 'update_call'):
             # PocketIC
-            cid = canister_id if isinstance(canister_id, Principal) else Principal.from_str(canister_id)
-            client.update_call(cid, "load_asset", encode(args))
+            client.update_call(cid, "load_asset", payload)
         else:
             # Agent
-            client.update_raw(canister_id, "load_asset", encode(args))
+            client.update_raw(canister_id, "load_asset", payload)
         
         offset += actual_size
         chunk_num += 1
@@ -72,7 +76,7 @@ def upload_test_asset(client, canister_id: str, name: str, data: bytes):
 def reset_assets(client, canister_id):
     """Reset all assets in canister."""
     if hasattr(client, 'update_call'):
-        cid = canister_id if isinstance(canister_id, Principal) else Principal.from_str(canister_id)
+        cid = _as_principal(canister_id)
         client.update_call(cid, "reset_assets", encode([]))
     else:
         client.update_raw(canister_id, "reset_assets", encode([]))
@@ -83,7 +87,7 @@ def get_asset_hash_from_canister(client, canister_id, name: str) -> int:
     args = [{"type": Types.Text, "value": name}]
     
     if hasattr(client, 'query_call'):
-        cid = canister_id if isinstance(canister_id, Principal) else Principal.from_str(canister_id)
+        cid = _as_principal(canister_id)
         result = client.query_call(cid, "compute_asset_hash", encode(args))
     else:
         result = client.query_raw(canister_id, "compute_asset_hash", encode(args))
@@ -104,16 +108,21 @@ def get_asset_sample_from_canister(client, canister_id, name: str, offset: int,
     ]
     
     if hasattr(client, 'query_call'):
-        cid = canister_id if isinstance(canister_id, Principal) else Principal.from_str(canister_id)
+        cid = _as_principal(canister_id)
         result = client.query_call(cid, "get_asset_sample", encode(args))
     else:
         result = client.query_raw(canister_id, "get_asset_sample", encode(args))
     
+    if isinstance(result, (bytes, bytearray)):
+        blob = decode_blob_reply(result)
+        if blob is not None:
+            return blob
+
     decoded = decode(result)
     
     if decoded and len(decoded) > 0:
         blob = decoded[0]['value']
-        return bytes(blob)
+        return blob if isinstance(blob, bytes) else bytes(blob)
     return b""
 
 
@@ -121,10 +130,35 @@ def verify_asset_readback(client, canister_id: str, name: str, original_data: by
     """Verify asset can be read back from stable memory correctly."""
     print(f"\n=== Verifying '{name}' readback from stable memory ===")
     
+    test_samples = [
+        (0, min(1024, len(original_data))),  # First 1KB
+        (len(original_data) // 2, min(1024, len(original_data) // 2)),  # Middle 1KB
+        (max(0, len(original_data) - 1024), min(1024, len(original_data))),  # Last 1KB
+    ]
+
     # 1. Verify hash
     print("\n1. Computing and comparing hash...")
-    local_hash = compute_local_hash(original_data)
-    canister_hash = get_asset_hash_from_canister(client, canister_id, name)
+    if hasattr(client, 'query_call'):
+        # PocketIC: its client is not documented as thread-safe, and the
+        # instance runs calls one at a time anyway, so query in order.
+        canister_hash = get_asset_hash_from_canister(client, canister_id, name)
+        samples = [
+            get_asset_sample_from_canister(client, canister_id, name, offset, length)
+            for offset, length in test_samples
+        ]
+        local_hash = compute_local_hash(original_data)
+    else:
+        # Agent: the hash and sample queries are independent replica round
+        # trips, so issue them together and check the results in order.
+        with ThreadPoolExecutor(max_workers=1 + len(test_samples)) as pool:
+            hash_future = pool.submit(get_asset_hash_from_canister, client, canister_id, name)
+            sample_futures = [
+                pool.submit(get_asset_sample_from_canister, client, canister_id, name, offset, length)
+                for offset, length in test_samples
+            ]
+            local_hash = compute_local_hash(original_data)
+            canister_hash = hash_future.result()
+            samples = [future.result() for future in sample_futures]
     
     print(f"   Local hash:    {local_hash:#010x} ({local_hash})")
     print(f"   Canister hash: {canister_hash:#010x} ({canister_hash})")
@@ -136,15 +170,8 @@ def verify_asset_readback(client, canister_id: str, name: str, original_data: by
     
     # 2. Verify sample reads at different offsets
     print("\n2. Verifying sample reads from stable memory...")
-    test_samples = [
-        (0, min(1024, len(original_data))),  # First 1KB
-        (len(original_data) // 2, min(1024, len(original_data) // 2)),  # Middle 1KB
-        (max(0, len(original_data) - 1024), min(1024, len(original_data))),  # Last 1KB
-    ]
-    
-    for offset, length in test_samples:
+    for (offset, length), actual in zip(test_samples, samples):
         expected = original_data[offset:offset + length]
-        actual = get_asset_sample_from_canister(client, canister_id, name, offset, length)
         
         if expected != actual:
             print(f"   ✗ Sample mismatch at offset {offset}, length {length}")
@@ -157,7 +184,7 @@ def verify_asset_readback(client, canister_id: str, name: str, original_data: by
     return True
 
 
-def test_single_chunk_readback(client, canister_id: str):
+def run_single_chunk_readback(client, canister_id: str) -> bool:
     """Test 1-chunk file upload and readback."""
     print("\n" + "="*70)
     print("TEST 1: Single Chunk Upload and Stable Memory Read (1 MB)")
@@ -187,7 +214,7 @@ def test_single_chunk_readback(client, canister_id: str):
     return success
 
 
-def test_two_chunks_readback(client, canister_id: str):
+def run_two_chunks_readback(client, canister_id: str) -> bool:
     """Test 2-chunk file upload and readback."""
     print("\n" + "="*70)
     print("TEST 2: Two Chunks Upload and Stable Memory Read (3 MB)")
@@ -219,6 +246,36 @@ def test_two_chunks_readback(client, canister_id: str):
     return success
 
 
+@pytest.fixture(scope="session")
+def pocketic_canister():
+    """Install llm_c on PocketIC once and share it across the readback tests."""
+    pytest.importorskip("pocket_ic")
+    from test.support.test_support_pocketic import install_example_canister
+
+    try:
+        return install_example_canister("llm_c", auto_build=False)
+    except FileNotFoundError:
+        pytest.skip("llm_c wasm not built")
+
+
+@pytest.fixture
+def client(pocketic_canister):
+    return pocketic_canister[0]
+
+
+@pytest.fixture
+def canister_id(pocketic_canister):
+    return pocketic_canister[1]
+
+
+def test_single_chunk_readback(client, canister_id):
+    assert run_single_chunk_readback(client, canister_id)
+
+
+def test_two_chunks_readback(client, canister_id):
+    assert run_two_chunks_readback(client, canister_id)
+
+
 def main():
     """Run all stable memory read verification tests."""
     parser = argparse.ArgumentParser(description='Test stable memory read correctness')
@@ -261,7 +318,7 @@ def main():
     results = []
     
     try:
-        results.append(("Single Chunk Read", test_single_chunk_readback(client, canister_id)))
+        results.append(("Single Chunk Read", run_single_chunk_readback(client, canister_id)))
     except Exception as e:
         print(f"\n✗ TEST 1 EXCEPTION: {e}")
         import traceback
@@ -269,7 +326,7 @@ def main():
         results.append(("Single Chunk Read", False))
     
     try:
-        results.append(("Two Chunks Read", test_two_chunks_readback(client, canister_id)))
+        results.append(("Two Chunks Read", run_two_chunks_readback(client, canister_id)))
     except Exception as e:
         print(f"\n✗ TEST 2 EXCEPTION: {e}")
         import traceback
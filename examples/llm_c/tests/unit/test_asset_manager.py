@@ -52,3 +52,15 @@ def test_checkpoint_validation():
                 assert True  # Valid checkpoint
             else:
                 pytest.skip("Checkpoint has unexpected format")
+
+
+def test_create_test_file_exact_size():
+    """Test pattern data has the exact requested size and content."""
+    sys.path.insert(0, str(pathlib.Path(__file__).parent.parent.parent))
+    from tests.utils.fixtures import create_test_file
+
+    for size in (0, 1, 25, 26, 27, 3 * 1024 * 1024):
+        pattern = b"TEST_DATA_PATTERN_" + str(size).encode() + b"_"
+        data = create_test_file(size)
+        assert len(data) == size
+        assert data == (pattern * (size // len(pattern) + 1))[:size]
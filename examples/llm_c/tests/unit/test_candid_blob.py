@@ -0,0 +1,67 @@
+"""Unit tests for the direct (text, blob) Candid encoder."""
+
+from __future__ import annotations
+
+import pytest
+
+from tests.utils.candid_blob import (
+    decode_blob_reply,
+    encode_text_blob,
+    read_uleb128,
+    text_blob_prefix,
+    uleb128,
+)
+
+
+def test_uleb128() -> None:
+    assert uleb128(0) == b"\x00"
+    assert uleb128(127) == b"\x7f"
+    assert uleb128(128) == b"\x80\x01"
+    assert uleb128(1_900_000) == b"\xe0\xfb\x73"
+
+
+def test_uleb128_negative_raises() -> None:
+    with pytest.raises(ValueError):
+        uleb128(-1)
+
+
+def test_encode_text_blob_layout() -> None:
+    payload = encode_text_blob("vocab", b"\x00\x01\xff")
+    assert payload == b"DIDL\x01\x6d\x7b\x02\x71\x00" + b"\x05vocab" + b"\x03\x00\x01\xff"
+
+
+def test_read_uleb128_roundtrip() -> None:
+    for value in (0, 1, 127, 128, 1_900_000):
+        assert read_uleb128(b"\xaa" + uleb128(value), 1) == (value, 1 + len(uleb128(value)))
+    with pytest.raises(ValueError):
+        read_uleb128(b"\x80")
+
+
+def test_decode_blob_reply() -> None:
+    payload = bytes(range(256)) * 5
+    raw = b"DIDL\x01\x6d\x7b\x01\x00" + uleb128(len(payload)) + payload
+    assert decode_blob_reply(raw) == payload
+    assert decode_blob_reply(raw[:-1]) is None
+    assert decode_blob_reply(b"DIDL\x00\x01\x71\x00") is None
+
+
+def test_text_blob_prefix_is_payload_head() -> None:
+    assert text_blob_prefix("vocab") == b"DIDL\x01\x6d\x7b\x02\x71\x00\x05vocab"
+    assert encode_text_blob("vocab", b"ab").startswith(text_blob_prefix("vocab"))
+
+
+def test_encode_text_blob_accepts_memoryview() -> None:
+    data = bytes(range(256)) * 3
+    assert encode_text_blob("x", memoryview(data)[10:20]) == encode_text_blob("x", data[10:20])
+
+
+def test_encode_text_blob_matches_ic_py() -> None:
+    candid = pytest.importorskip("ic.candid")
+    data = bytes(range(200))
+    expected = candid.encode(
+        [
+            {"type": candid.Types.Text, "value": "checkpoint"},
+            {"type": candid.Types.Vec(candid.Types.Nat8), "value": list(data)},
+        ]
+    )
+    assert encode_text_blob("checkpoint", data) == expected
@@ -0,0 +1,49 @@
+"""Unit tests for the local DJB2 hash used to check stable-memory readback."""
+
+from __future__ import annotations
+
+import pytest
+
+from tests.utils import djb2 as djb2_mod
+from tests.utils.djb2 import DJB2_SEED, djb2, djb2_python
+
+
+def _djb2_reference(data: bytes) -> int:
+    hash_val = DJB2_SEED
+    for byte in data:
+        hash_val = ((hash_val << 5) + hash_val + byte) & 0xFFFFFFFF
+    return hash_val
+
+
+def test_djb2_python_matches_reference() -> None:
+    data = bytes(range(256)) * 3 + b"TEST_DATA_PATTERN_"
+    for size in (0, 1, 7, 8, 9, 15, 16, 17, len(data)):
+        assert djb2_python(data[:size]) == _djb2_reference(data[:size])
+
+
+def test_djb2_empty_is_seed() -> None:
+    assert djb2(b"") == DJB2_SEED
+
+
+def test_djb2_known_value() -> None:
+    # ((5381 * 33) + ord("a")) & 0xFFFFFFFF
+    assert djb2_python(b"a") == 177670
+    assert djb2(b"a") == 177670
+
+
+def test_djb2_numpy_matches_reference() -> None:
+    pytest.importorskip("numpy")
+    pattern = bytes(range(256)) * 17 + b"TEST_DATA_PATTERN_"
+    for data in (b"", b"\xff", pattern, pattern * 700):
+        assert djb2_mod.djb2_numpy(data) == _djb2_reference(data)
+
+
+def test_djb2_numpy_crosses_block_boundary(monkeypatch: pytest.MonkeyPatch) -> None:
+    pytest.importorskip("numpy")
+    monkeypatch.setattr(djb2_mod, "_BLOCK", 64)
+    djb2_mod._block_weights.cache_clear()
+    try:
+        data = bytes(range(200)) * 3
+        assert djb2_mod.djb2_numpy(data) == _djb2_reference(data)
+    finally:
+        djb2_mod._block_weights.cache_clear()
@@ -15,49 +15,37 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from tests.utils.gguf_helper import get_model_fixture, verify_model_file, download_model
 
+# GGUF header: magic (4 bytes), version (uint32), tensor count (uint64), metadata KV count (uint64)
+_GGUF_HEADER = struct.Struct('<4sIQQ')
 
-def test_gguf_parse_basic():
+
+def test_gguf_parse_basic(gguf_model):
     """
     Test 1: GGUF File Parse
     
     Verify file format (magic number, version) and parse header successfully.
     """
     # Get model file
-    model_path = get_model_fixture()
+    model_path = gguf_model
     
     # Verify file exists
     assert model_path.exists(), f"Model file not found: {model_path}"
     
-    # Read header
+    # Read the whole header in one go
     with open(model_path, 'rb') as f:
-        # Read magic number (4 bytes)
-        magic = f.read(4)
-        assert len(magic) == 4, "Failed to read magic number"
-        
-        # Verify GGUF magic: 0x47 0x47 0x55 0x46 ("GGUF")
-        assert magic == b'GGUF', f"Invalid magic number: {magic.hex()}"
-        
-        # Read version (4 bytes, little-endian uint32)
-        version_bytes = f.read(4)
-        assert len(version_bytes) == 4, "Failed to read version"
-        version = struct.unpack('<I', version_bytes)[0]
-        
-        # Verify version (should be 3 for current GGUF spec)
-        assert version == 3, f"Unexpected GGUF version: {version}"
-        
-        # Read tensor count (8 bytes, little-endian uint64)
-        tensor_count_bytes = f.read(8)
-        assert len(tensor_count_bytes) == 8, "Failed to read tensor count"
-        tensor_count = struct.unpack('<Q', tensor_count_bytes)[0]
-        
-        assert tensor_count > 0, f"Invalid tensor count: {tensor_count}"
-        
-        # Read metadata KV count (8 bytes, little-endian uint64)
-        kv_count_bytes = f.read(8)
-        assert len(kv_count_bytes) == 8, "Failed to read metadata KV count"
-        kv_count = struct.unpack('<Q', kv_count_bytes)[0]
-        
-        assert kv_count >= 0, f"Invalid metadata KV count: {kv_count}"
+        header = f.read(_GGUF_HEADER.size)
+    assert len(header) == _GGUF_HEADER.size, f"Failed to read GGUF header ({len(header)} bytes)"
+    magic, version, tensor_count, kv_count = _GGUF_HEADER.unpack(header)
+    
+    # Verify GGUF magic: 0x47 0x47 0x55 0x46 ("GGUF")
+    assert magic == b'GGUF', f"Invalid magic number: {magic.hex()}"
+    
+    # Verify version (should be 3 for current GGUF spec)
+    assert version == 3, f"Unexpected GGUF version: {version}"
+    
+    assert tensor_count > 0, f"Invalid tensor count: {tensor_count}"
+    
+    assert kv_count >= 0, f"Invalid metadata KV count: {kv_count}"
     
     print(f"✓ GGUF file parsed successfully:")
     print(f"  Version: {version}")
@@ -65,7 +53,7 @@ def test_gguf_parse_basic():
     print(f"  Metadata KVs: {kv_count}")
 
 
-def test_gguf_metadata_valid():
+def test_gguf_metadata_valid(gguf_model):
     """
     Test 2: Metadata Validation
     
@@ -75,23 +63,17 @@ def test_gguf_metadata_valid():
     # This test requires C library integration
     # For now, we'll verify file structure
     
-    model_path = get_model_fixture()
+    model_path = gguf_model
     
     # Verify file is valid GGUF
     with open(model_path, 'rb') as f:
-        magic = f.read(4)
+        # Read magic, version (unused here), tensor and KV counts in one go
+        magic, _version, tensor_count, kv_count = _GGUF_HEADER.unpack(f.read(_GGUF_HEADER.size))
         assert magic == b'GGUF', "Not a valid GGUF file"
         
-        # Skip version
-        f.read(4)
-        
-        # Read tensor and KV counts
-        tensor_count = struct.unpack('<Q', f.read(8))[0]
-        kv_count = struct.unpack('<Q', f.read(8))[0]
-        
         # Skip to metadata section (after header)
         # Header is 24 bytes total
-        header_size = 24
+        header_size = _GGUF_HEADER.size
         
         # Parse metadata key-value pairs
         # Each KV has: string length (8 bytes) + string + value type (4 bytes) + value
@@ -108,7 +90,7 @@ def test_gguf_metadata_valid():
     # This will be tested in integration tests
 
 
-def test_gguf_weights_load():
+def test_gguf_weights_load(gguf_model):
     """
     Test 3: Weights Loading
     
@@ -117,7 +99,7 @@ def test_gguf_weights_load():
     # This test requires C library and model loading
     # For now, we verify file structure supports weight loading
     
-    model_path = get_model_fixture()
+    model_path = gguf_model
     
     # Verify file exists and has reasonable size
     assert verify_model_file(model_path), "Model file verification failed"
@@ -138,7 +120,7 @@ def test_gguf_weights_load():
     print(f"  Weight loading will be tested in integration tests")
 
 
-def test_gguf_tokenizer_extract():
+def test_gguf_tokenizer_extract(gguf_model):
     """
     Test 4: Tokenizer Extraction
     
@@ -147,7 +129,7 @@ def test_gguf_tokenizer_extract():
     # This test requires C library integration
     # For now, we verify file structure
     
-    model_path = get_model_fixture()
+    model_path = gguf_model
     
     # Verify file is valid
     with open(model_path, 'rb') as f:
@@ -163,7 +145,7 @@ def test_gguf_tokenizer_extract():
     print(f"  Tokenizer extraction will be tested in integration tests")
 
 
-def test_gguf_inference_native():
+def test_gguf_inference_native(gguf_model):
     """
     Test 5: End-to-End Inference
     
@@ -173,7 +155,7 @@ def test_gguf_inference_native():
     # This test requires full C library integration and native build
     # For now, we verify prerequisites
     
-    model_path = get_model_fixture()
+    model_path = gguf_model
     
     # Verify model file exists
     assert model_path.exists(), f"Model file not found: {model_path}"
@@ -201,15 +183,15 @@ if __name__ == "__main__":
     if len(sys.argv) > 1:
         test_name = sys.argv[1]
         if test_name == "parse":
-            test_gguf_parse_basic()
+            test_gguf_parse_basic(get_model_fixture())
         elif test_name == "metadata":
-            test_gguf_metadata_valid()
+            test_gguf_metadata_valid(get_model_fixture())
         elif test_name == "weights":
-            test_gguf_weights_load()
+            test_gguf_weights_load(get_model_fixture())
         elif test_name == "tokenizer":
-            test_gguf_tokenizer_extract()
+            test_gguf_tokenizer_extract(get_model_fixture())
         elif test_name == "inference":
-            test_gguf_inference_native()
+            test_gguf_inference_native(get_model_fixture())
         else:
             print(f"Unknown test: {test_name}")
             sys.exit(1)
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import mmap
 import pathlib
 from typing import TYPE_CHECKING
 
+from .candid_blob import encode_text_blob
+
 if TYPE_CHECKING:
     from ic.agent import Agent
 
@@ -13,17 +16,11 @@ def load_asset_chunk(
     agent: Agent,
     canister_id: str,
     name: str,
-    chunk: bytes,
+    chunk: bytes | memoryview,
     chunk_index: int,
 ) -> None:
     """Load a single chunk of an asset."""
-    from ic.candid import encode, Types
-
-    args = [
-        {"type": Types.Text, "value": name},
-        {"type": Types.Vec(Types.Nat8), "value": list(chunk)},
-    ]
-    agent.update_raw(canister_id, "load_asset", encode(args))
+    agent.update_raw(canister_id, "load_asset", encode_text_blob(name, chunk))
     print(f"...{name}: sent chunk {chunk_index} ({len(chunk)} bytes)")
 
 
@@ -46,14 +43,21 @@ def load_asset_file(
     chunk_index = 0
     total_bytes = 0
     
-    with path.open("rb") as asset_file:
-        while True:
-            chunk = asset_file.read(chunk_size)
-            if not chunk:
-                break
-            chunk_index += 1
-            load_asset_chunk(agent, canister_id, name, chunk, chunk_index)
-            total_bytes += len(chunk)
+    size = path.stat().st_size
+    # Map the file and send memoryview slices: no per-chunk bytes copy before
+    # the Candid framing. Empty files cannot be mapped and have no chunks.
+    if size:
+        with path.open("rb") as asset_file, mmap.mmap(
+            asset_file.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mapped:
+            if hasattr(mapped, "madvise"):
+                mapped.madvise(mmap.MADV_SEQUENTIAL)
+            with memoryview(mapped) as view:
+                for offset in range(0, size, chunk_size):
+                    with view[offset:offset + chunk_size] as chunk:
+                        chunk_index += 1
+                        load_asset_chunk(agent, canister_id, name, chunk, chunk_index)
+                        total_bytes += len(chunk)
     
     print(f"...{name} loaded ({total_bytes} bytes in {chunk_index} chunks)")
     return total_bytes
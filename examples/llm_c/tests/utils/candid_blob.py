@@ -0,0 +1,73 @@
+"""Direct Candid framing for the (text, blob) arguments of load_asset.
+
+ic-py only encodes ``vec nat8`` from a Python list of ints, which costs one
+list slot and one int lookup per byte. ``(text, blob)`` has a fixed layout,
+so the payload can be assembled straight from the raw bytes instead.
+"""
+
+from __future__ import annotations
+
+import functools
+
+# "DIDL", one table entry: vec (-19) of nat8 (-5); two args: text (-15), type #0.
+TEXT_BLOB_HEADER = b"DIDL\x01\x6d\x7b\x02\x71\x00"
+# Same table, a single arg of type #0: the reply of a `-> (blob)` method.
+BLOB_REPLY_HEADER = b"DIDL\x01\x6d\x7b\x01\x00"
+
+
+def uleb128(value: int) -> bytes:
+    """Encode a non-negative integer as unsigned LEB128."""
+    if value < 0:
+        raise ValueError("uleb128 value must be non-negative")
+    out = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return bytes(out)
+
+
+def read_uleb128(data: bytes, pos: int = 0) -> tuple[int, int]:
+    """Decode an unsigned LEB128 at ``pos``; return (value, next position)."""
+    value = 0
+    shift = 0
+    while True:
+        if pos >= len(data):
+            raise ValueError("truncated uleb128")
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return value, pos
+        shift += 7
+
+
+@functools.lru_cache(maxsize=32)
+def text_blob_prefix(text: str) -> bytes:
+    """Return the header and encoded ``text`` shared by every chunk of an asset."""
+    name = text.encode("utf-8")
+    return TEXT_BLOB_HEADER + uleb128(len(name)) + name
+
+
+def encode_text_blob(text: str, blob: bytes | bytearray | memoryview) -> bytes:
+    """Return the Candid encoding of ``(text, blob)``."""
+    return b"".join((text_blob_prefix(text), uleb128(len(blob)), blob))
+
+
+def decode_blob_reply(raw: bytes) -> bytes | None:
+    """Return the payload of a ``(blob)`` reply, or None if ``raw`` has another layout.
+
+    Slices the bytes out directly; ic-py would decode them into a list of ints.
+    """
+    if not raw.startswith(BLOB_REPLY_HEADER):
+        return None
+    try:
+        length, pos = read_uleb128(raw, len(BLOB_REPLY_HEADER))
+    except ValueError:
+        return None
+    if pos + length != len(raw):
+        return None
+    return bytes(raw[pos:])
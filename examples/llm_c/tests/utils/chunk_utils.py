@@ -10,16 +10,12 @@ def chunk_sizes(total_bytes: int, chunk_size: int = DEFAULT_CHUNK_SIZE) -> list[
     """Return the sizes of fragments required to cover *total_bytes*."""
     if total_bytes < 0:
         raise ValueError("total_bytes must be non-negative")
-    sizes: list[int] = []
-    offset = 0
-    while offset < total_bytes:
-        remaining = total_bytes - offset
-        sizes.append(chunk_size if remaining >= chunk_size else remaining)
-        offset += chunk_size
-    return sizes
+    full, rest = divmod(total_bytes, chunk_size)
+    return [chunk_size] * full + ([rest] if rest else [])
 
 
 def max_chunk_size(total_bytes: int, chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
     """Return the size of the largest chunk needed for the given payload."""
-    sizes = chunk_sizes(total_bytes, chunk_size)
-    return max(sizes) if sizes else 0
+    if total_bytes < 0:
+        raise ValueError("total_bytes must be non-negative")
+    return min(total_bytes, chunk_size)
@@ -0,0 +1,74 @@
+"""DJB2 hash matching the canister's `compute_asset_hash` (32-bit, h*33 + c)."""
+
+from __future__ import annotations
+
+import functools
+
+try:
+    import numpy as np
+except ImportError:  # optional speedup; the pure-Python loop is always available
+    np = None
+
+DJB2_SEED = 5381
+_MASK = 0xFFFFFFFF
+# Bytes folded per vectorized step. 2**20 * 255 * 2**32 < 2**63, so the
+# weighted sum of one block cannot overflow uint64.
+_BLOCK = 1 << 20
+# 33**k mod 2**32 for k = 0..8, used to fold eight bytes per loop step.
+_POW33 = tuple(pow(33, k, 1 << 32) for k in range(9))
+
+
+def djb2_python(data: bytes | bytearray | memoryview, seed: int = DJB2_SEED) -> int:
+    """Pure-Python DJB2, folding eight bytes per iteration.
+
+    Eight steps of ``h = h*33 + b`` equal
+    ``h*33**8 + b0*33**7 + ... + b6*33 + b7``, so the loop runs len/8 times.
+    """
+    data = bytes(data)
+    p1, p2, p3, p4, p5, p6, p7, p8 = _POW33[1:]
+    whole = len(data) & ~7
+    hash_val = seed
+    it = iter(data[:whole])
+    for b0, b1, b2, b3, b4, b5, b6, b7 in zip(it, it, it, it, it, it, it, it):
+        hash_val = (
+            hash_val * p8 + b0 * p7 + b1 * p6 + b2 * p5 + b3 * p4 + b4 * p3 + b5 * p2 + b6 * p1 + b7
+        ) & _MASK
+    for byte in data[whole:]:
+        hash_val = ((hash_val << 5) + hash_val + byte) & _MASK  # hash * 33 + c, keep 32-bit
+    return hash_val
+
+
+@functools.lru_cache(maxsize=1)
+def _block_weights():
+    """Return ``33**(_BLOCK - 1 - i) mod 2**32`` for i in range(_BLOCK), as uint64."""
+    powers = np.full(_BLOCK, 33, dtype=np.uint32)
+    powers[0] = 1
+    # uint32 products wrap, which is exactly the mod 2**32 the hash needs.
+    return np.cumprod(powers, dtype=np.uint32)[::-1].astype(np.uint64)
+
+
+def djb2_numpy(data: bytes | bytearray | memoryview, seed: int = DJB2_SEED) -> int:
+    """Vectorized DJB2.
+
+    Unrolling ``h = h*33 + b`` over a block of n bytes gives
+    ``h*33**n + sum(b[i] * 33**(n-1-i))`` (mod 2**32), so each block is one
+    dot product against a cached table of powers of 33.
+    """
+    if np is None:
+        raise RuntimeError("numpy is not installed")
+    arr = np.frombuffer(data, dtype=np.uint8)
+    weights = _block_weights()
+    hash_val = seed
+    for start in range(0, len(arr), _BLOCK):
+        block = arr[start:start + _BLOCK]
+        n = len(block)
+        poly = int(np.dot(block.astype(np.uint64), weights[_BLOCK - n:]))
+        hash_val = (hash_val * pow(33, n, 1 << 32) + poly) & _MASK
+    return hash_val
+
+
+def djb2(data: bytes | bytearray | memoryview, seed: int = DJB2_SEED) -> int:
+    """Return the 32-bit DJB2 hash of ``data``, vectorized when numpy is present."""
+    if np is not None:
+        return djb2_numpy(data, seed)
+    return djb2_python(data, seed)
@@ -25,3 +25,15 @@ def get_test_assets() -> dict[str, pathlib.Path]:
             assets["merges"] = vocab_bpe
     
     return assets
+
+
+def create_test_file(size: int) -> bytes:
+    """Return *size* bytes of a repeating, size-tagged pattern.
+
+    ``bytes * n`` fills by doubling memcpy, so repeating the whole pattern
+    and appending the remainder is one exact-size pass; no oversize buffer
+    or slice copy is needed.
+    """
+    pattern = b"TEST_DATA_PATTERN_" + str(size).encode() + b"_"
+    reps, rem = divmod(size, len(pattern))
+    return pattern * reps + pattern[:rem]
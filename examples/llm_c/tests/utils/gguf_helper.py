@@ -38,27 +38,33 @@ def download_model(force: bool = False) -> Optional[Path]:
     
     try:
         from huggingface_hub import hf_hub_download
-        
-        print(f"Downloading {GGUF_MODEL_FILE} from {GGUF_MODEL_REPO}...")
-        downloaded_path = hf_hub_download(
-            repo_id=GGUF_MODEL_REPO,
-            filename=GGUF_MODEL_FILE,
-            local_dir=str(model_path.parent),
-            local_dir_use_symlinks=False
-        )
-        
-        # Ensure it's in the expected location
-        if downloaded_path != str(model_path):
-            import shutil
-            shutil.move(downloaded_path, str(model_path))
-        
-        print(f"Downloaded to {model_path}")
-        return model_path
-        
     except ImportError:
         print("Error: huggingface_hub not installed. Install with:")
         print("  pip install -U 'huggingface_hub[cli]'")
         return None
+    
+    try:
+        # Without local_dir the file lands in the shared Hugging Face cache
+        # (~/.cache/huggingface), which other checkouts reuse; lib/ only gets
+        # a symlink to it rather than a second copy of the model.
+        print(f"Fetching {GGUF_MODEL_FILE} from {GGUF_MODEL_REPO} (Hugging Face cache)...")
+        cached = Path(hf_hub_download(
+            repo_id=GGUF_MODEL_REPO,
+            filename=GGUF_MODEL_FILE,
+            force_download=force,
+        ))
+        model_path.parent.mkdir(parents=True, exist_ok=True)
+        if model_path.is_symlink() or model_path.exists():
+            model_path.unlink()
+        try:
+            model_path.symlink_to(cached)
+        except OSError:
+            # No symlink support (e.g. Windows without developer mode).
+            print(f"Using cached model at {cached}")
+            return cached
+        print(f"Linked {model_path} -> {cached}")
+        return model_path
+        
     except Exception as e:
         print(f"Error downloading model: {e}")
         return None
@@ -76,12 +82,13 @@ def verify_model_file(model_path: Optional[Path] = None) -> bool:
     if model_path is None:
         model_path = get_model_path()
     
-    if not model_path.exists():
+    # One stat() both checks existence and gets the size (should be around 8MB)
+    try:
+        size = model_path.stat().st_size
+    except FileNotFoundError:
         return False
     
-    # Check file size (should be around 8MB)
-    size = model_path.stat().st_size
-    if size < GGUF_MODEL_SIZE * 0.9 or size > GGUF_MODEL_SIZE * 1.1:
+    if not GGUF_MODEL_SIZE * 0.9 <= size <= GGUF_MODEL_SIZE * 1.1:
         print(f"Warning: Model file size {size} differs from expected ~{GGUF_MODEL_SIZE}")
         # Don't fail, just warn
     
@@ -0,0 +1,27 @@
+"""Cheap reachability checks and tooling paths for the local replica."""
+
+from __future__ import annotations
+
+import os
+import shutil
+import socket
+from urllib.parse import urlsplit
+
+DEFAULT_REPLICA_URL = "http://127.0.0.1:4943"
+# Resolved once so repeated dfx invocations skip the PATH search.
+DFX = shutil.which("dfx") or "dfx"
+
+
+def replica_address(url: str | None = None) -> tuple[str, int]:
+    """Return (host, port) of the replica URL (LLM_TEST_REPLICA by default)."""
+    parts = urlsplit(url or os.environ.get("LLM_TEST_REPLICA", DEFAULT_REPLICA_URL))
+    return parts.hostname or "127.0.0.1", parts.port or 4943
+
+
+def tcp_alive(url: str | None = None, timeout: float = 0.2) -> bool:
+    """Return True if something accepts TCP connections on the replica port."""
+    try:
+        with socket.create_connection(replica_address(url), timeout):
+            return True
+    except OSError:
+        return False
@@ -1,11 +1,15 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 import os
+import pathlib
 import subprocess
+import sys
 from ic.agent import Agent
 from ic.client import Client
 from ic.identity import Identity
-from ic.candid import encode, Types
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent / "tests"))
+from utils.candid_blob import encode_text_blob
 
 def main():
     for proxy in ("HTTP_PROXY","http_proxy","HTTPS_PROXY","https_proxy","ALL_PROXY","all_proxy"):
@@ -15,9 +19,8 @@ def main():
     sizes = [8<<10, 32<<10, 64<<10, 80<<10, 128<<10, 256<<10, 512<<10, 1024<<10, 2*1024<<10, 3*1024<<10]
     for size in sizes:
         chunk = bytes([size % 256]) * size
-        args = [{"type": Types.Text, "value": "chunk_probe"}, {"type": Types.Vec(Types.Nat8), "value": list(chunk)}]
         try:
-            agent.update_raw(canister_id,"load_asset",encode(args))
+            agent.update_raw(canister_id,"load_asset",encode_text_blob("chunk_probe", chunk))
             print(f"SUCCESS size={size} bytes")
         except Exception as exc:
             print(f"FAIL size={size} => {exc}")
@@ -3,10 +3,20 @@
 Helper to encode a text prompt with tiktoken, call the C inference binary, and decode output tokens.
 """
 import argparse
+import array
+import functools
+import os
+import struct
 import subprocess
 import sys
 from pathlib import Path
 
+_DEFAULT_BIN = Path(__file__).resolve().parent.parent / "run_gpt2.out"
+
+# tiktoken's default cache lives under the temp dir, which gets cleaned and
+# forces a re-download of the BPE files; keep it somewhere stable instead.
+os.environ.setdefault("TIKTOKEN_CACHE_DIR", str(Path.home() / ".cache" / "tiktoken"))
+
 try:
     import tiktoken
 except ImportError as e:
@@ -18,7 +28,11 @@ def parse_args():
     ap = argparse.ArgumentParser(
         description="Run GPT-2 C inference with a text prompt."
     )
-    ap.add_argument("--prompt", required=True, help="Input text prompt")
+    ap.add_argument(
+        "--prompt",
+        action="append",
+        help="Input text prompt (repeat to run several against one loaded model)",
+    )
     ap.add_argument(
         "--max-new", type=int, default=32, help="Max new tokens to generate"
     )
@@ -29,28 +43,135 @@ def parse_args():
     )
     ap.add_argument(
         "--run-bin",
-        default=str(Path(__file__).resolve().parent.parent / "run_gpt2.out"),
+        default=str(_DEFAULT_BIN),
         help="Path to compiled run_gpt2 binary",
     )
-    return ap.parse_args()
+    ap.add_argument(
+        "--no-server",
+        action="store_true",
+        help="Launch run_gpt2 once per prompt instead of keeping a --server worker",
+    )
+    ap.add_argument(
+        "--exec",
+        action="store_true",
+        help="For a single prompt, exec run_gpt2 in place of Python (it prints "
+        "and decodes the result itself)",
+    )
+    ap.add_argument(
+        "--vocab",
+        default="vocab/encoder.json",
+        help="GPT-2 encoder.json for run_gpt2's own decoding (--exec)",
+    )
+    ap.add_argument(
+        "--merges",
+        default="vocab/vocab.bpe",
+        help="GPT-2 vocab.bpe for run_gpt2's own decoding (--exec)",
+    )
+    ap.add_argument(
+        "--debug",
+        action="store_true",
+        help="Pass through run_gpt2's stderr with --no-server",
+    )
+    ap.add_argument(
+        "--warm-cache",
+        action="store_true",
+        help="Only populate the tiktoken cache (e.g. during venv setup) and exit",
+    )
+    args = ap.parse_args()
+    if args.prompt is None and not args.warm_cache:
+        ap.error("--prompt is required")
+    return args
+
+
+@functools.lru_cache(maxsize=None)
+def _enc():
+    return tiktoken.get_encoding("gpt2")
 
 
 def encode(prompt: str):
-    enc = tiktoken.get_encoding("gpt2")
-    return enc.encode(prompt)
+    return _enc().encode(prompt)
 
 
 def decode(tokens):
-    enc = tiktoken.get_encoding("gpt2")
-    return enc.decode(tokens)
+    return _enc().decode(tokens)
+
+
+def _pack_tokens(token_ids):
+    packed = array.array("i", token_ids)
+    if sys.byteorder == "big":
+        packed.byteswap()
+    return packed
+
+
+class Gpt2Worker:
+    """A `run_gpt2 --server` process that keeps the checkpoint loaded.
 
+    Requests and replies are little-endian int32 frames on the worker's
+    stdin/stdout (see run_server in src/tools/run_gpt2.c); the worker's own
+    logging goes to stderr.
+    """
 
-def call_run_gpt2(run_bin, token_ids, max_new, temp, top_k, ckpt):
-    tokens_arg = " ".join(str(t) for t in token_ids)
-    cmd = [
+    _REQUEST = struct.Struct("<iiif")
+    _COUNT = struct.Struct("<i")
+
+    def __init__(self, run_bin, ckpt):
+        self.proc = subprocess.Popen(
+            [str(run_bin), "--server", "--ckpt", ckpt],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            bufsize=-1,
+        )
+
+    def generate(self, token_ids, max_new, temp, top_k):
+        """Return the full token sequence (prompt + generated)."""
+        packed = _pack_tokens(token_ids)
+        try:
+            self.proc.stdin.write(
+                self._REQUEST.pack(len(packed), max_new, top_k, temp)
+            )
+            self.proc.stdin.write(packed.tobytes())
+            self.proc.stdin.flush()
+        except BrokenPipeError:
+            raise SystemExit(self.proc.wait() or 1)
+        header = self.proc.stdout.read(self._COUNT.size)
+        if len(header) != self._COUNT.size:
+            raise SystemExit(self.proc.wait() or 1)
+        (count,) = self._COUNT.unpack(header)
+        if count < 0:
+            raise ValueError(f"run_gpt2 rejected a prompt of {len(packed)} tokens")
+        tokens = array.array("i")
+        tokens.frombytes(self.proc.stdout.read(count * tokens.itemsize))
+        if sys.byteorder == "big":
+            tokens.byteswap()
+        return tokens.tolist()
+
+    def close(self):
+        if self.proc.poll() is None:
+            try:
+                # a zero-length prompt asks the worker to exit
+                self.proc.stdin.write(self._REQUEST.pack(0, 0, 0, 0.0))
+                self.proc.stdin.close()
+            except BrokenPipeError:
+                pass
+        self.proc.wait()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+_MARKER = b"Generated token ids:"
+# Linux's default pipe capacity; exec_run_gpt2 must not block filling it.
+_PIPE_CAPACITY = 65536
+
+
+def _run_gpt2_cmd(run_bin, tokens_fd, max_new, temp, top_k, ckpt):
+    return [
         str(run_bin),
-        "--tokens",
-        tokens_arg,
+        "--tokens-fd",
+        str(tokens_fd),
         "--max-new",
         str(max_new),
         "--temp",
@@ -60,45 +181,144 @@ def call_run_gpt2(run_bin, token_ids, max_new, temp, top_k, ckpt):
         "--ckpt",
         ckpt,
     ]
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    if result.returncode != 0:
-        sys.stderr.write(result.stdout)
-        sys.stderr.write(result.stderr)
-        raise SystemExit(result.returncode)
-    return result.stdout
+
+
+def exec_run_gpt2(run_bin, token_ids, max_new, temp, top_k, ckpt, vocab, merges):
+    """Replace this process with run_gpt2 for a single generation.
+
+    The tokens are written to a pipe that run_gpt2 reads via --tokens-fd, and
+    run_gpt2 decodes its own output (--decode, using its vocab files), so the
+    interpreter and tiktoken tables are gone for the whole inference.
+    Returns only if the tokens do not fit in the pipe without blocking,
+    after warning on stderr.
+    """
+    data = _pack_tokens(token_ids).tobytes()
+    if len(data) > _PIPE_CAPACITY:
+        sys.stderr.write(
+            f"--exec: {len(token_ids)} prompt tokens exceed the {_PIPE_CAPACITY}-byte "
+            "pipe buffer; falling back to a subprocess\n"
+        )
+        return
+    read_fd, write_fd = os.pipe()
+    os.write(write_fd, data)
+    os.close(write_fd)
+    os.set_inheritable(read_fd, True)
+    cmd = _run_gpt2_cmd(run_bin, read_fd, max_new, temp, top_k, ckpt)
+    cmd += ["--decode", "--vocab", vocab, "--merges", merges]
+    # Printed only now that exec is certain; the fallback paths report it.
+    print("Prompt tokens:", token_ids)
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os.execv(cmd[0], cmd)
+
+
+def call_run_gpt2(run_bin, token_ids, max_new, temp, top_k, ckpt, debug=False):
+    # Hand the prompt over stdin as raw little-endian int32s rather than a
+    # space-joined argv string.
+    packed = _pack_tokens(token_ids)
+    cmd = _run_gpt2_cmd(run_bin, 0, max_new, temp, top_k, ckpt)
+    proc = subprocess.Popen(
+        cmd,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=None if debug else subprocess.DEVNULL,
+        bufsize=65536,
+    )
+    # run_gpt2 reads the whole prompt before printing, so this cannot block.
+    proc.stdin.write(packed.tobytes())
+    proc.stdin.close()
+
+    # Stop reading as soon as the token line is in; anything printed after it
+    # (decoded text, stats) is never parsed.
+    preamble = []
+    result = None
+    for line in proc.stdout:
+        if line.startswith(_MARKER):
+            result = (line + proc.stdout.readline()).decode(errors="replace")
+            break
+        preamble.append(line)
+    proc.stdout.close()
+    # Once the token line is in, the exit status only reflects output we
+    # chose not to read (typically SIGPIPE), so it is not checked.
+    returncode = proc.wait()
+    if result is not None:
+        return result
+    sys.stderr.write(b"".join(preamble).decode(errors="replace"))
+    raise SystemExit(returncode or 1)
 
 
 def extract_generated_tokens(run_output: str):
-    lines = [ln.strip() for ln in run_output.splitlines() if ln.strip()]
-    # find the line after "Generated token ids:"
-    for i, ln in enumerate(lines):
-        if ln.startswith("Generated token ids:"):
-            if i + 1 < len(lines):
-                tok_line = lines[i + 1]
-                return [int(x) for x in tok_line.split()]
-    raise ValueError("Could not parse generated tokens from run_gpt2 output")
+    # run_gpt2 prints the ids on the single line right after the marker
+    idx = run_output.find("Generated token ids:")
+    if idx < 0:
+        raise ValueError("Could not parse generated tokens from run_gpt2 output")
+    lines = run_output[idx:].split("\n", 2)
+    if len(lines) < 2:
+        raise ValueError("Could not parse generated tokens from run_gpt2 output")
+    return list(map(int, lines[1].split()))
 
 
 def main():
     args = parse_args()
-    prompt_tokens = encode(args.prompt)
+    if args.warm_cache:
+        _enc()
+        print(f"tiktoken gpt2 encoding cached in {os.environ['TIKTOKEN_CACHE_DIR']}")
+        return
     run_bin = Path(args.run_bin)
     if not run_bin.exists():
-        fallback = Path(__file__).resolve().parent.parent / "run_gpt2.out"
-        if fallback.exists():
-            run_bin = fallback
+        if _DEFAULT_BIN.exists():
+            run_bin = _DEFAULT_BIN
         else:
             sys.stderr.write(f"run_gpt2 binary not found at {run_bin}\n")
             raise SystemExit(1)
-    run_out = call_run_gpt2(
-        run_bin, prompt_tokens, args.max_new, args.temp, args.top_k, args.ckpt
-    )
-    try:
-        gen_tokens = extract_generated_tokens(run_out)
-    except ValueError as e:
-        sys.stderr.write(run_out)
-        raise
 
+    if args.exec and len(args.prompt) > 1:
+        sys.stderr.write(
+            f"--exec: ignored with {len(args.prompt)} prompts; it replaces the process "
+            "for a single generation\n"
+        )
+    elif args.exec:
+        exec_run_gpt2(
+            run_bin,
+            encode(args.prompt[0]),
+            args.max_new,
+            args.temp,
+            args.top_k,
+            args.ckpt,
+            args.vocab,
+            args.merges,
+        )
+
+    if args.no_server:
+        for prompt in args.prompt:
+            prompt_tokens = encode(prompt)
+            run_out = call_run_gpt2(
+                run_bin,
+                prompt_tokens,
+                args.max_new,
+                args.temp,
+                args.top_k,
+                args.ckpt,
+                debug=args.debug,
+            )
+            try:
+                gen_tokens = extract_generated_tokens(run_out)
+            except ValueError as e:
+                sys.stderr.write(run_out)
+                raise
+            report(prompt_tokens, gen_tokens)
+        return
+
+    with Gpt2Worker(run_bin, args.ckpt) as worker:
+        for prompt in args.prompt:
+            prompt_tokens = encode(prompt)
+            gen_tokens = worker.generate(
+                prompt_tokens, args.max_new, args.temp, args.top_k
+            )
+            report(prompt_tokens, gen_tokens)
+
+
+def report(prompt_tokens, gen_tokens):
     text = decode(gen_tokens)
     print("Prompt tokens:", prompt_tokens)
     print("Generated tokens:", gen_tokens)
@@ -23,6 +23,12 @@ Usage:
     # Note: Use -s flag to see build output: pytest -s examples/records/records_test.py
     pytest examples/records/records_test.py -k greet
 
+    # Show request/response payload dumps (hex + structured decode)
+    pytest examples/records/records_test.py -k get_address --log-cli-level=DEBUG
+
+    # Run tests in parallel (pytest-xdist; one canister per worker)
+    pytest -n auto --dist=loadgroup examples/records/records_test.py
+
     # Run all tests (backward compatibility)
     python3 examples/records/records_test.py
 """
@@ -34,6 +40,7 @@ Usage:
 # pyright: reportOptionalMemberAccess=false
 # pyright: reportArgumentType=false
 
+import logging
 import sys
 from pathlib import Path
 
@@ -45,10 +52,9 @@ if str(project_root) not in sys.path:
 import pytest  # type: ignore[reportMissingImports]
 from ic.candid import Types, encode, decode
 from ic.principal import Principal
-from test.support.test_support_pocketic import (
-    decode_candid_text,
-    install_example_canister,
-)
+from test.support.test_support_pocketic import decode_candid_text
+
+logger = logging.getLogger(__name__)
 
 
 # Pytest hook to ensure build output is visible
@@ -76,20 +82,53 @@ def decode_single(response_bytes: bytes, ret_type) -> dict:
     return result[0]["value"]
 
 
+def _hex_preview(data: bytes, n: int = 32) -> str:
+    """Hex of at most the first n bytes, so debug logging stays O(1) in size."""
+    return memoryview(data)[:n].hex() + ("..." if len(data) > n else "")
+
+
 def opt_to_value(opt_value):
     """Convert candid opt list representation to a Python optional."""
     return opt_value[0] if opt_value else None
 
 
-@pytest.fixture(scope="module")
-def pic_and_canister():
-    """Pytest fixture: Build and install canister once for all tests in this module."""
+# Fixed call arguments, encoded once at import.
+_GREET_PAYLOAD = encode([{"type": Types.Text, "value": "World"}])
+_ADD_USER_PAYLOAD = encode(
+    [
+        {"type": Types.Text, "value": "Alice"},
+        {"type": Types.Nat, "value": 25},
+        {"type": Types.Bool, "value": True},
+    ]
+)
+_GET_ADDRESS_PAYLOAD = encode([{"type": Types.Text, "value": "Main"}])
+_GET_PROFILE_PAYLOAD = encode([{"type": Types.Text, "value": "Bob"}])
+_GET_USER_INFO_PAYLOAD = encode([{"type": Types.Text, "value": "Charlie"}])
+_GET_NESTED_DATA_PAYLOAD = encode([{"type": Types.Text, "value": "Dave"}])
+_GET_OPTIONAL_DATA_WITH_AGE_PAYLOAD = encode(
+    [
+        {"type": Types.Text, "value": "Eve"},
+        {"type": Types.Bool, "value": True},
+    ]
+)
+_GET_OPTIONAL_DATA_WITHOUT_AGE_PAYLOAD = encode(
+    [
+        {"type": Types.Text, "value": "Frank"},
+        {"type": Types.Bool, "value": False},
+    ]
+)
+_GET_COMPLEX_RECORD_PAYLOAD = encode([{"type": Types.Text, "value": "Grace"}])
+
+
+@pytest.fixture(scope="session")
+def pic_and_canister(example_canister):
+    """Pytest fixture: Build and install canister once for the whole session."""
     import sys
 
     # Use stderr to ensure output is visible even when pytest captures stdout
     sys.stderr.write("\n[Setup] Building and installing canister...\n")
     sys.stderr.flush()
-    pic, canister_id = install_example_canister("records", auto_build=True)
+    pic, canister_id = example_canister("records")
     sys.stderr.write(f"[Setup] Canister installed: {canister_id}\n\n")
     sys.stderr.flush()
     return pic, canister_id
@@ -101,39 +140,30 @@ def pic(pic_and_canister):
     return pic_and_canister[0]
 
 
-@pytest.fixture
-def canister_id(pic_and_canister):
-    """Pytest fixture: Extract canister ID."""
-    return pic_and_canister[1]
+@pytest.fixture(scope="session")
+def canister_id(pic_and_canister) -> Principal:
+    """Pytest fixture: Canister ID as a Principal, converted once per session."""
+    return ensure_principal(pic_and_canister[1])
 
 
 def test_greet(pic, canister_id) -> None:
     """Test greet: (text) -> (text) query"""
     print("\n=== Test: greet ===")
-    principal_id = ensure_principal(canister_id)
 
     # Call greet with a name parameter
-    params = [{"type": Types.Text, "value": "World"}]
-    payload = encode(params)
-    response_bytes = pic.query_call(principal_id, "greet", payload)
+    response_bytes = pic.query_call(canister_id, "greet", _GREET_PAYLOAD)
     decoded = decode_candid_text(response_bytes)
     print(f"greet('World') -> {decoded!r}")
     assert "Hello" in decoded and "World" in decoded, f"Unexpected response: {decoded}"
 
 
+@pytest.mark.xdist_group("records_state")
 def test_add_user(pic, canister_id) -> None:
     """Test add_user: (text, nat, bool) -> (text)"""
     print("\n=== Test: add_user ===")
-    principal_id = ensure_principal(canister_id)
 
     # Call add_user with multiple parameters
-    params = [
-        {"type": Types.Text, "value": "Alice"},
-        {"type": Types.Nat, "value": 25},
-        {"type": Types.Bool, "value": True},
-    ]
-    payload = encode(params)
-    response_bytes = pic.update_call(principal_id, "add_user", payload)
+    response_bytes = pic.update_call(canister_id, "add_user", _ADD_USER_PAYLOAD)
     decoded = decode_candid_text(response_bytes)
     print(f"add_user('Alice', 25, True) -> {decoded!r}")
     assert (
@@ -144,48 +174,27 @@ def test_add_user(pic, canister_id) -> None:
 def test_get_address(pic, canister_id) -> None:
     """Test get_address: (text) -> (opt record { street : text; city : text; zip : nat })"""
     print("\n=== Test: get_address (Macro API) ===")
-    principal_id = ensure_principal(canister_id)
-
-    params = [{"type": Types.Text, "value": "Main"}]
-    payload = encode(params)
-
-    # Debug: Print payload information
-    print(f"[DEBUG] Request params: {params}")
-    print(f"[DEBUG] Payload length: {len(payload)} bytes")
-    payload_hex = payload.hex()
-    if len(payload_hex) > 64:
-        print(f"[DEBUG] Payload (hex, first 32 bytes): {payload_hex[:64]}...")
-        print(f"[DEBUG] Payload (hex, full): {payload_hex}")
-    else:
-        print(f"[DEBUG] Payload (hex): {payload_hex}")
-
-    response_bytes = pic.query_call(principal_id, "get_address", payload)
-
-    # Debug: Print response information
-    print(f"[DEBUG] Response length: {len(response_bytes)} bytes")
-    response_hex = response_bytes.hex()
-    print(f"[DEBUG] Response (hex, full {len(response_bytes)} bytes): {response_hex}")
-    if len(response_hex) > 64:
-        print(f"[DEBUG] Response (hex, first 32 bytes preview): {response_hex[:64]}...")
-
-    # Try to decode with standard decode() to get structured data
-    try:
-        decoded_result = decode(response_bytes)
-        print(f"[DEBUG] Decoded result (structured): {decoded_result}")
-        if decoded_result and len(decoded_result) > 0:
-            opt_record = decoded_result[0]
-            if opt_record is not None:
-                print(f"[DEBUG] Address record fields: {opt_record}")
-                if isinstance(opt_record, dict):
-                    print(f"[DEBUG]   - street: {opt_record.get('street', 'N/A')}")
-                    print(f"[DEBUG]   - city: {opt_record.get('city', 'N/A')}")
-                    print(f"[DEBUG]   - zip: {opt_record.get('zip', 'N/A')}")
-    except Exception as e:
-        print(f"[DEBUG] Standard decode() failed (may have field sorting issues): {e}")
+
+    payload = _GET_ADDRESS_PAYLOAD
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Payload (%d bytes, hex): %s", len(payload), _hex_preview(payload))
+
+    response_bytes = pic.query_call(canister_id, "get_address", payload)
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Response (%d bytes, hex): %s", len(response_bytes), _hex_preview(response_bytes)
+        )
+        # Try to decode with standard decode() to get structured data
+        try:
+            decoded_result = decode(response_bytes)
+            logger.debug("Decoded result (structured): %s", decoded_result)
+        except Exception as e:
+            logger.debug("Standard decode() failed (may have field sorting issues): %s", e)
 
     # Also use decode_candid_text as fallback/alternative view
     decoded_text = decode_candid_text(response_bytes)
-    print(f"[DEBUG] Decoded (text extraction): {decoded_text!r}")
     print(f"get_address('Main') -> {decoded_text!r}")
 
     # Basic validation - response should not be empty
@@ -197,11 +206,8 @@ def test_get_address(pic, canister_id) -> None:
 def test_get_profile(pic, canister_id) -> None:
     """Test get_profile: (text) -> (record { name : text; age : nat; active : bool })"""
     print("\n=== Test: get_profile (Builder API) ===")
-    principal_id = ensure_principal(canister_id)
 
-    params = [{"type": Types.Text, "value": "Bob"}]
-    payload = encode(params)
-    response_bytes = pic.query_call(principal_id, "get_profile", payload)
+    response_bytes = pic.query_call(canister_id, "get_profile", _GET_PROFILE_PAYLOAD)
     profile_type = Types.Record(
         {"name": Types.Text, "age": Types.Nat32, "active": Types.Bool}
     )
@@ -219,11 +225,10 @@ def test_get_profile(pic, canister_id) -> None:
 def test_get_user_info(pic, canister_id) -> None:
     """Test get_user_info: (text) -> (record { id : nat; emails : vec text; tags : vec text })"""
     print("\n=== Test: get_user_info (Vector API) ===")
-    principal_id = ensure_principal(canister_id)
 
-    params = [{"type": Types.Text, "value": "Charlie"}]
-    payload = encode(params)
-    response_bytes = pic.query_call(principal_id, "get_user_info", payload)
+    response_bytes = pic.query_call(
+        canister_id, "get_user_info", _GET_USER_INFO_PAYLOAD
+    )
     info_type = Types.Record(
         {
             "id": Types.Nat32,
@@ -245,11 +250,10 @@ def test_get_user_info(pic, canister_id) -> None:
 def test_get_nested_data(pic, canister_id) -> None:
     """Test get_nested_data: (text) -> (record { user : record { name : text; age : nat }; timestamp : nat })"""
     print("\n=== Test: get_nested_data (Nested Records) ===")
-    principal_id = ensure_principal(canister_id)
 
-    params = [{"type": Types.Text, "value": "Dave"}]
-    payload = encode(params)
-    response_bytes = pic.query_call(principal_id, "get_nested_data", payload)
+    response_bytes = pic.query_call(
+        canister_id, "get_nested_data", _GET_NESTED_DATA_PAYLOAD
+    )
     user_type = Types.Record({"name": Types.Text, "age": Types.Nat32})
     data_type = Types.Record({"user": user_type, "timestamp": Types.Nat64})
     data = decode_single(response_bytes, data_type)
@@ -267,14 +271,10 @@ def test_get_nested_data(pic, canister_id) -> None:
 def test_get_optional_data_with_age(pic, canister_id) -> None:
     """Test get_optional_data with age: (text, bool) -> (record { name : text; age : opt nat })"""
     print("\n=== Test: get_optional_data (with age) ===")
-    principal_id = ensure_principal(canister_id)
 
-    params = [
-        {"type": Types.Text, "value": "Eve"},
-        {"type": Types.Bool, "value": True},
-    ]
-    payload = encode(params)
-    response_bytes = pic.query_call(principal_id, "get_optional_data", payload)
+    response_bytes = pic.query_call(
+        canister_id, "get_optional_data", _GET_OPTIONAL_DATA_WITH_AGE_PAYLOAD
+    )
     data_type = Types.Record(
         {"name": Types.Text, "age": Types.Opt(Types.Nat32)}
     )
@@ -292,14 +292,10 @@ def test_get_optional_data_with_age(pic, canister_id) -> None:
 def test_get_optional_data_without_age(pic, canister_id) -> None:
     """Test get_optional_data without age: (text, bool) -> (record { name : text; age : opt nat })"""
     print("\n=== Test: get_optional_data (without age) ===")
-    principal_id = ensure_principal(canister_id)
 
-    params = [
-        {"type": Types.Text, "value": "Frank"},
-        {"type": Types.Bool, "value": False},
-    ]
-    payload = encode(params)
-    response_bytes = pic.query_call(principal_id, "get_optional_data", payload)
+    response_bytes = pic.query_call(
+        canister_id, "get_optional_data", _GET_OPTIONAL_DATA_WITHOUT_AGE_PAYLOAD
+    )
     data_type = Types.Record(
         {"name": Types.Text, "age": Types.Opt(Types.Nat32)}
     )
@@ -316,11 +312,10 @@ def test_get_optional_data_without_age(pic, canister_id) -> None:
 def test_get_complex_record(pic, canister_id) -> None:
     """Test get_complex_record: (text) -> (record with all types)"""
     print("\n=== Test: get_complex_record (All Types) ===")
-    principal_id = ensure_principal(canister_id)
 
-    params = [{"type": Types.Text, "value": "Grace"}]
-    payload = encode(params)
-    response_bytes = pic.query_call(principal_id, "get_complex_record", payload)
+    response_bytes = pic.query_call(
+        canister_id, "get_complex_record", _GET_COMPLEX_RECORD_PAYLOAD
+    )
     record_type = Types.Record(
         {
             "name": Types.Text,
@@ -21,6 +21,12 @@ Usage:
     # Note: Use -s flag to see build output: pytest -s examples/types_example/te_test.py
     pytest examples/types_example/te_test.py -k greet
 
+    # Show the decoded replies
+    pytest --log-cli-level=DEBUG examples/types_example/te_test.py
+
+    # Run tests in parallel (pytest-xdist; one canister per worker)
+    pytest -n auto --dist=loadgroup examples/types_example/te_test.py
+
     # Run all tests (backward compatibility)
     python3 examples/types_example/te_test.py
 """
@@ -32,6 +38,7 @@ Usage:
 # pyright: reportOptionalMemberAccess=false
 # pyright: reportArgumentType=false
 
+import logging
 import sys
 from pathlib import Path
 
@@ -43,10 +50,9 @@ if str(project_root) not in sys.path:
 import pytest  # type: ignore[reportMissingImports]
 from ic.candid import Types, encode
 from ic.principal import Principal
-from test.support.test_support_pocketic import (
-    decode_candid_text,
-    install_example_canister,
-)
+from test.support.test_support_pocketic import decode_candid_text
+
+logger = logging.getLogger(__name__)
 
 
 # Pytest hook to ensure build output is visible
@@ -67,15 +73,124 @@ def ensure_principal(canister_id) -> Principal:
     return Principal.from_str(str(canister_id))
 
 
-@pytest.fixture(scope="module")
-def pic_and_canister():
-    """Pytest fixture: Build and install canister once for all tests in this module."""
+# Candid types shared by the tests, built once at import.
+# pyright: ignore[reportArgumentType]
+_ADDRESS_TYPE = Types.Record({"street": Types.Text, "city": Types.Text, "zip": Types.Nat})
+_STATUS_TYPE = Types.Variant(  # type: ignore[arg-type]
+    {"Active": Types.Null, "Inactive": Types.Null, "Banned": Types.Text}
+)
+_PROFILE_TYPE = Types.Record(  # type: ignore[arg-type]
+    {
+        "id": Types.Nat,
+        "name": Types.Text,
+        "emails": Types.Vec(Types.Text),  # type: ignore[arg-type]
+        "age": Types.Opt(Types.Nat),  # type: ignore[arg-type]
+        "status": _STATUS_TYPE,
+    }
+)
+_PROFILE_VEC_TYPE = Types.Vec(_PROFILE_TYPE)  # type: ignore[arg-type]
+# Details record: { count: nat; items: vec nat }
+_DETAILS_TYPE = Types.Record({"count": Types.Nat, "items": Types.Vec(Types.Nat)})  # type: ignore[arg-type]
+# Metadata record: { tags: vec text; status: variant; details: record }
+_METADATA_TYPE = Types.Record(  # type: ignore[arg-type]
+    {
+        "tags": Types.Vec(Types.Text),  # type: ignore[arg-type]
+        "status": _STATUS_TYPE,
+        "details": _DETAILS_TYPE,
+    }
+)
+# Item record: { value: text; score: nat }
+_ITEM_TYPE = Types.Record({"value": Types.Text, "score": Types.Nat})  # type: ignore[arg-type]
+# Main input record: { id: nat; name: text; active: bool; metadata: opt record; items: vec record }
+_INPUT_RECORD_TYPE = Types.Record(  # type: ignore[arg-type]
+    {
+        "id": Types.Nat,
+        "name": Types.Text,
+        "active": Types.Bool,
+        "metadata": Types.Opt(_METADATA_TYPE),  # type: ignore[arg-type]
+        "items": Types.Vec(_ITEM_TYPE),  # type: ignore[arg-type]
+    }
+)
+_INPUT_RECORD_VEC_TYPE = Types.Vec(_INPUT_RECORD_TYPE)  # type: ignore[arg-type]
+
+
+# Fixed update-call arguments, encoded once at import.
+_ADD_USER_PAYLOAD = encode(
+    [
+        {"type": Types.Text, "value": "Alice"},
+        {"type": Types.Nat, "value": 25},
+        {"type": Types.Bool, "value": True},
+    ]
+)
+_SET_ADDRESS_PAYLOAD = encode(
+    [
+        {"type": Types.Text, "value": "Bob"},
+        {
+            "type": _ADDRESS_TYPE,
+            "value": {"street": "123 Main St", "city": "San Francisco", "zip": 94102},
+        },
+    ]
+)
+_SET_STATUS_ACTIVE_PAYLOAD = encode(
+    [
+        {"type": Types.Text, "value": "user1"},
+        {"type": _STATUS_TYPE, "value": {"Active": None}},
+    ]
+)
+_SET_STATUS_BANNED_PAYLOAD = encode(
+    [
+        {"type": Types.Text, "value": "user2"},
+        {"type": _STATUS_TYPE, "value": {"Banned": "spam detected"}},
+    ]
+)
+_PROFILE_VALUE = {
+    "id": 1,
+    "name": "Test User",
+    "emails": ["test@example.com"],
+    "age": [30],  # Opt: [value] means Some(value)
+    "status": {"Active": None},  # Variant
+}
+_CREATE_PROFILES_PAYLOAD = encode(
+    [{"type": _PROFILE_VEC_TYPE, "value": [_PROFILE_VALUE]}]
+)
+# Input value with all types and double nesting
+_COMPLEX_INPUT_VALUE = {
+    "id": 1,
+    "name": "Test Complex",
+    "active": True,
+    "metadata": [
+        {
+            "tags": ["tag1", "tag2", "tag3"],
+            "status": {"Active": None},
+            "details": {"count": 5, "items": [10, 20, 30, 40, 50]},
+        }
+    ],  # Opt: [value] means Some(value)
+    "items": [
+        {"value": "item1", "score": 100},
+        {"value": "item2", "score": 200},
+    ],
+}
+_COMPLEX_TEST_PAYLOAD = encode(
+    [{"type": _INPUT_RECORD_VEC_TYPE, "value": [_COMPLEX_INPUT_VALUE]}]
+)
+
+# Query payloads, encoded once at import.
+_GREET_PAYLOAD = encode([{"type": Types.Text, "value": "World"}])
+_GET_ADDRESS_PAYLOAD = encode([{"type": Types.Text, "value": "Alice"}])
+_GET_STATUS_PAYLOAD = encode([{"type": Types.Text, "value": "user1"}])
+_FIND_PROFILE_PAYLOAD = encode([{"type": Types.Nat, "value": 7}])
+_STATS_PAYLOAD = encode([])
+
+
+@pytest.fixture(scope="session")
+def pic_and_canister(example_canister):
+    """Pytest fixture: Build and install canister once for the whole session."""
     import sys
 
     # Use stderr to ensure output is visible even when pytest captures stdout
     sys.stderr.write("\n[Setup] Building and installing canister...\n")
     sys.stderr.flush()
-    pic, canister_id = install_example_canister("types_example", auto_build=True)
+    pic, canister_id = example_canister("types_example")
     sys.stderr.write(f"[Setup] Canister installed: {canister_id}\n\n")
     sys.stderr.flush()
     return pic, canister_id
@@ -87,282 +202,131 @@ def pic(pic_and_canister):
     return pic_and_canister[0]
 
 
-@pytest.fixture
-def canister_id(pic_and_canister):
-    """Pytest fixture: Extract canister ID."""
-    return pic_and_canister[1]
+@pytest.fixture(scope="session")
+def canister_id(pic_and_canister) -> Principal:
+    """Pytest fixture: Canister ID as a Principal, converted once per session."""
+    return ensure_principal(pic_and_canister[1])
 
 
 def test_greet(pic, canister_id) -> None:
     """Test greet: (text) -> (text) query"""
-    print("\n=== Test: greet ===")
-    principal_id = ensure_principal(canister_id)
-
-    # Call greet with a name
-    params = [{"type": Types.Text, "value": "World"}]
-    payload = encode(params)
-    response_bytes = pic.query_call(principal_id, "greet", payload)
+    response_bytes = pic.query_call(canister_id, "greet", _GREET_PAYLOAD)
     decoded = decode_candid_text(response_bytes)
-    print(f"greet('World') -> {decoded!r}")
+    logger.debug("greet('World') -> %r", decoded)
     assert "Hello" in decoded or "World" in decoded, f"Unexpected response: {decoded}"
 
 
+@pytest.mark.xdist_group("types_example_state")
 def test_add_user(pic, canister_id) -> None:
     """Test add_user: (text, nat, bool) -> (text)"""
-    print("\n=== Test: add_user ===")
-
-    # Call add_user with multiple parameters
-    params = [
-        {"type": Types.Text, "value": "Alice"},
-        {"type": Types.Nat, "value": 25},
-        {"type": Types.Bool, "value": True},
-    ]
-    payload = encode(params)
-    principal_id = ensure_principal(canister_id)
-    response_bytes = pic.update_call(principal_id, "add_user", payload)
+    response_bytes = pic.update_call(canister_id, "add_user", _ADD_USER_PAYLOAD)
     decoded = decode_candid_text(response_bytes)
-    print(f"add_user('Alice', 25, True) -> {decoded!r}")
+    logger.debug("add_user('Alice', 25, True) -> %r", decoded)
     assert (
         "Alice" in decoded and "successfully" in decoded
     ), f"Unexpected response: {decoded}"
 
 
+@pytest.mark.xdist_group("types_example_state")
 def test_set_address(pic, canister_id) -> None:
     """Test set_address: (text, record) -> (text)"""
-    print("\n=== Test: set_address ===")
-    principal_id = ensure_principal(canister_id)
-
-    # Define Record type using Types.Record
-    # pyright: ignore[reportArgumentType]
-    address_type = Types.Record(
-        {"street": Types.Text, "city": Types.Text, "zip": Types.Nat}
-    )
-
-    # Encode parameters with proper format
-    params = [
-        {"type": Types.Text, "value": "Bob"},
-        {
-            "type": address_type,
-            "value": {"street": "123 Main St", "city": "San Francisco", "zip": 94102},
-        },
-    ]
-
-    payload = encode(params)
-    response_bytes = pic.update_call(principal_id, "set_address", payload)
+    response_bytes = pic.update_call(canister_id, "set_address", _SET_ADDRESS_PAYLOAD)
     decoded = decode_candid_text(response_bytes)
-    print(
-        f"set_address('Bob', {{street: '...', city: '...', zip: 94102}}) -> {decoded!r}"
+    logger.debug(
+        "set_address('Bob', {street: '...', city: '...', zip: 94102}) -> %r", decoded
     )
     assert (
         "Bob" in decoded and "successfully" in decoded
     ), f"Unexpected response: {decoded}"
 
 
+@pytest.mark.xdist_group("types_example_state")
 def test_get_address(pic, canister_id) -> None:
     """Test get_address: (text) -> (opt record) query"""
-    print("\n=== Test: get_address ===")
-
-    params = [{"type": Types.Text, "value": "Alice"}]
-    payload = encode(params)
-    principal_id = ensure_principal(canister_id)
-    response_bytes = pic.query_call(principal_id, "get_address", payload)
-    decoded = decode_candid_text(response_bytes)
-    print(f"get_address('Alice') -> {decoded!r}")
+    response_bytes = pic.query_call(canister_id, "get_address", _GET_ADDRESS_PAYLOAD)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("get_address('Alice') -> %r", decode_candid_text(response_bytes))
     # Should return an optional address record
     assert response_bytes is not None
 
 
+@pytest.mark.xdist_group("types_example_state")
 def test_set_status(pic, canister_id) -> None:
     """Test set_status: (text, variant) -> (text)"""
-    print("\n=== Test: set_status ===")
-    principal_id = ensure_principal(canister_id)
-
-    # Define Variant type using Types.Variant
-    # pyright: ignore[reportArgumentType]
-    status_type = Types.Variant(
-        {"Active": Types.Null, "Inactive": Types.Null, "Banned": Types.Text}
-    )
-
     # Test with Active variant (no data)
-    params = [
-        {"type": Types.Text, "value": "user1"},
-        {"type": status_type, "value": {"Active": None}},
-    ]
-
-    payload = encode(params)
-    response_bytes = pic.update_call(principal_id, "set_status", payload)
+    response_bytes = pic.update_call(
+        canister_id, "set_status", _SET_STATUS_ACTIVE_PAYLOAD
+    )
     decoded = decode_candid_text(response_bytes)
-    print(f"set_status('user1', Active) -> {decoded!r}")
+    logger.debug("set_status('user1', Active) -> %r", decoded)
     assert (
         "user1" in decoded and "successfully" in decoded
     ), f"Unexpected response: {decoded}"
 
     # Test with Banned variant (with text data)
-    params2 = [
-        {"type": Types.Text, "value": "user2"},
-        {"type": status_type, "value": {"Banned": "spam detected"}},
-    ]
-    payload2 = encode(params2)
-    response_bytes2 = pic.update_call(principal_id, "set_status", payload2)
+    response_bytes2 = pic.update_call(
+        canister_id, "set_status", _SET_STATUS_BANNED_PAYLOAD
+    )
     decoded2 = decode_candid_text(response_bytes2)
-    print(f"set_status('user2', Banned('spam detected')) -> {decoded2!r}")
+    logger.debug("set_status('user2', Banned('spam detected')) -> %r", decoded2)
     assert (
         "user2" in decoded2 and "successfully" in decoded2
     ), f"Unexpected response: {decoded2}"
 
 
+@pytest.mark.xdist_group("types_example_state")
 def test_get_status(pic, canister_id) -> None:
     """Test get_status: (text) -> (variant) query"""
-    print("\n=== Test: get_status ===")
-
-    params = [{"type": Types.Text, "value": "user1"}]
-    payload = encode(params)
-    principal_id = ensure_principal(canister_id)
-    response_bytes = pic.query_call(principal_id, "get_status", payload)
-    decoded = decode_candid_text(response_bytes)
-    print(f"get_status('user1') -> {decoded!r}")
+    response_bytes = pic.query_call(canister_id, "get_status", _GET_STATUS_PAYLOAD)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("get_status('user1') -> %r", decode_candid_text(response_bytes))
     # Should return a variant (likely Banned based on implementation)
     assert response_bytes is not None
 
 
+@pytest.mark.xdist_group("types_example_state")
 def test_create_profiles(pic, canister_id) -> None:
     """Test create_profiles: (vec record) -> (vec variant)"""
-    print("\n=== Test: create_profiles ===")
-
-    principal_id = ensure_principal(canister_id)
-
-    # Define nested types
-    status_type = Types.Variant(  # type: ignore
-        {"Active": Types.Null, "Inactive": Types.Null, "Banned": Types.Text}
+    response_bytes = pic.update_call(
+        canister_id, "create_profiles", _CREATE_PROFILES_PAYLOAD
     )
-
-    profile_type = Types.Record(  # type: ignore[arg-type]
-        {
-            "id": Types.Nat,
-            "name": Types.Text,
-            "emails": Types.Vec(Types.Text),  # type: ignore[arg-type]
-            "age": Types.Opt(Types.Nat),  # type: ignore[arg-type]
-            "status": status_type,
-        }
-    )
-
-    # Create a profile value
-    profile_value = {
-        "id": 1,
-        "name": "Test User",
-        "emails": ["test@example.com"],
-        "age": [30],  # Opt: [value] means Some(value)
-        "status": {"Active": None},  # Variant
-    }
-
-    # Encode vec of profiles
-    params = [{"type": Types.Vec(profile_type), "value": [profile_value]}]  # type: ignore[arg-type]
-
-    payload = encode(params)
-    response_bytes = pic.update_call(principal_id, "create_profiles", payload)
-    decoded = decode_candid_text(response_bytes)
-    print(f"create_profiles([profile]) -> {decoded!r}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("create_profiles([profile]) -> %r", decode_candid_text(response_bytes))
     # Should return vec of Result variants (Ok/Err)
     assert response_bytes is not None
 
 
+@pytest.mark.xdist_group("types_example_state")
 def test_find_profile(pic, canister_id) -> None:
     """Test find_profile: (nat) -> (opt record) query"""
-    print("\n=== Test: find_profile ===")
-
-    params = [{"type": Types.Nat, "value": 7}]
-    payload = encode(params)
-    principal_id = ensure_principal(canister_id)
-    response_bytes = pic.query_call(principal_id, "find_profile", payload)
-    decoded = decode_candid_text(response_bytes)
-    print(f"find_profile(7) -> {decoded!r}")
+    response_bytes = pic.query_call(canister_id, "find_profile", _FIND_PROFILE_PAYLOAD)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("find_profile(7) -> %r", decode_candid_text(response_bytes))
     # Should return an optional profile record
     assert response_bytes is not None
 
 
+@pytest.mark.xdist_group("types_example_state")
 def test_stats(pic, canister_id) -> None:
     """Test stats: () -> (nat, vec nat, text) query"""
-    print("\n=== Test: stats ===")
-
-    # No parameters
-    params = []
-    payload = encode(params)
-    principal_id = ensure_principal(canister_id)
-    response_bytes = pic.query_call(principal_id, "stats", payload)
-    decoded = decode_candid_text(response_bytes)
-    print(f"stats() -> {decoded!r}")
+    response_bytes = pic.query_call(canister_id, "stats", _STATS_PAYLOAD)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("stats() -> %r", decode_candid_text(response_bytes))
     # Should return tuple: (nat, vec nat, text)
     assert response_bytes is not None
     # The decoded text should contain some indication of the response
     assert len(response_bytes) > 0
 
 
+@pytest.mark.xdist_group("types_example_state")
 def test_complex_test(pic, canister_id) -> None:
     """Test complex_test: (vec record with all types, double nesting) -> (vec variant)"""
-    print("\n=== Test: complex_test ===")
-    principal_id = ensure_principal(canister_id)
-
-    # Define nested types for input
-    # Status variant
-    status_type = Types.Variant(  # type: ignore[arg-type]
-        {"Active": Types.Null, "Inactive": Types.Null, "Banned": Types.Text}
-    )
-
-    # Details record: { count: nat; items: vec nat }
-    details_type = Types.Record({"count": Types.Nat, "items": Types.Vec(Types.Nat)})  # type: ignore[arg-type]
-
-    # Metadata record: { tags: vec text; status: variant; details: record }
-    metadata_type = Types.Record(  # type: ignore[arg-type]
-        {
-            "tags": Types.Vec(Types.Text),  # type: ignore[arg-type]
-            "status": status_type,
-            "details": details_type,
-        }
-    )
-
-    # Item record: { value: text; score: nat }
-    item_type = Types.Record({"value": Types.Text, "score": Types.Nat})  # type: ignore[arg-type]
-
-    # Main input record: { id: nat; name: text; active: bool; metadata: opt record; items: vec record }
-    input_record_type = Types.Record(  # type: ignore[arg-type]
-        {
-            "id": Types.Nat,
-            "name": Types.Text,
-            "active": Types.Bool,
-            "metadata": Types.Opt(metadata_type),  # type: ignore[arg-type]
-            "items": Types.Vec(item_type),  # type: ignore[arg-type]
-        }
-    )
-
-    # Build input value with all types and double nesting
-    input_value = {
-        "id": 1,
-        "name": "Test Complex",
-        "active": True,
-        "metadata": [
-            {
-                "tags": ["tag1", "tag2", "tag3"],
-                "status": {"Active": None},
-                "details": {"count": 5, "items": [10, 20, 30, 40, 50]},
-            }
-        ],  # Opt: [value] means Some(value)
-        "items": [
-            {"value": "item1", "score": 100},
-            {"value": "item2", "score": 200},
-        ],
-    }
-
-    # Encode vec of records
-    params = [{"type": Types.Vec(input_record_type), "value": [input_value]}]  # type: ignore[arg-type]
-
-    payload = encode(params)
-    response_bytes = pic.update_call(principal_id, "complex_test", payload)
-    decoded = decode_candid_text(response_bytes)
-    print(f"complex_test([complex_record]) -> {decoded!r}")
+    response_bytes = pic.update_call(canister_id, "complex_test", _COMPLEX_TEST_PAYLOAD)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("complex_test([complex_record]) -> %r", decode_candid_text(response_bytes))
     # Should return vec of Result variants (Ok/Err)
     assert response_bytes is not None
     assert len(response_bytes) > 0
-    print("✅ Complex test passed: all types with double nesting and vec")
 
 
 # Backward compatibility: Run all tests if executed directly
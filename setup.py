@@ -9,6 +9,9 @@ import subprocess
 import shutil
 import urllib.request
 import tarfile
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import time
 SCRIPT_DIR = Path(__file__).parent.resolve()
@@ -23,20 +26,93 @@ def run_cmd(cmd, check=True, shell=False):
     subprocess.run(cmd, check=check, shell=shell, text=True)
 
 
+# pattern -> export line, written to .bashrc in one go by flush_exports().
+_pending_exports = {}
+
+
 def persist_export(pattern, export_line):
-    """Persist export to .bashrc."""
-    if not BASHRC.exists():
-        BASHRC.write_text("")
+    """Queue an export for .bashrc (see flush_exports)."""
+    _pending_exports[pattern] = export_line
+
+
+def flush_exports():
+    """Persist queued exports to .bashrc with a single read and write."""
+    if not _pending_exports:
+        return
+    lines = BASHRC.read_text().splitlines() if BASHRC.exists() else []
 
-    lines = BASHRC.read_text().splitlines()
+    pending = dict(_pending_exports)
     for i, line in enumerate(lines):
-        if pattern in line:
-            lines[i] = export_line
-            BASHRC.write_text("\n".join(lines) + "\n")
-            return
+        for pattern in pending:
+            if pattern in line:
+                lines[i] = pending.pop(pattern)
+                break
+    lines.extend(pending.values())
 
-    lines.append(export_line)
     BASHRC.write_text("\n".join(lines) + "\n")
+    _pending_exports.clear()
+
+
+def download_and_extract(url, dest):
+    """Stream a .tar.gz from url into dest, without a temp archive.
+
+    The archive is unpacked into a staging directory inside dest and its
+    top-level entries are renamed into place only once it is complete, so a
+    dropped download never leaves a partial install for the exists() checks
+    to accept.
+    """
+    dest = Path(dest)
+    staging = Path(tempfile.mkdtemp(prefix=".extract-", dir=dest))
+    try:
+        _stream_extract(url, staging)
+        for entry in staging.iterdir():
+            target = dest / entry.name
+            if target.is_dir() and not target.is_symlink():
+                shutil.rmtree(target)
+            elif target.exists() or target.is_symlink():
+                target.unlink()
+            entry.rename(target)
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+
+
+# Reject absolute paths, ".." members and links that escape dest where tarfile
+# supports extraction filters (3.12+, and backported security releases).
+_EXTRACT_KWARGS = {"filter": "data"} if hasattr(tarfile, "data_filter") else {}
+
+
+def _stream_extract(url, dest):
+    """Stream a .tar.gz from url straight into dest.
+
+    When pigz is installed, gunzip runs in a separate pigz process so that
+    download, decompression and extraction overlap.
+    """
+    pigz = shutil.which("pigz")
+    with urllib.request.urlopen(url) as resp:
+        if not pigz:
+            with tarfile.open(fileobj=resp, mode="r|gz") as tar:
+                tar.extractall(dest, **_EXTRACT_KWARGS)
+            return
+
+        proc = subprocess.Popen([pigz, "-dc"], stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+
+        def feed():
+            try:
+                shutil.copyfileobj(resp, proc.stdin)
+            finally:
+                proc.stdin.close()
+
+        feeder = threading.Thread(target=feed, daemon=True)
+        feeder.start()
+        try:
+            with tarfile.open(fileobj=proc.stdout, mode="r|") as tar:
+                tar.extractall(dest, **_EXTRACT_KWARGS)
+        finally:
+            proc.stdout.close()
+            feeder.join()
+            returncode = proc.wait()
+        if returncode != 0:
+            raise subprocess.CalledProcessError(returncode, [pigz, "-dc"])
 
 
 def ensure_build_tools():
@@ -103,13 +179,8 @@ def ensure_wasi_sdk():
 
     INSTALL_DIR.mkdir(parents=True, exist_ok=True)
     url = f"https://github.com/WebAssembly/wasi-sdk/releases/download/wasi-sdk-25/{SDK_DIR}.tar.gz"
-    tar_path = INSTALL_DIR / f"{SDK_DIR}.tar.gz"
-
-    urllib.request.urlretrieve(url, tar_path)
-    with tarfile.open(tar_path, "r:gz") as tar:
-        tar.extractall(INSTALL_DIR)
 
-    tar_path.unlink()
+    download_and_extract(url, INSTALL_DIR)
     return str(SDK_PATH)
 
 
@@ -130,15 +201,9 @@ def ensure_candid_extractor():
     install_dir.mkdir(parents=True, exist_ok=True)
 
     url = get_candid_extractor_download_url()
-    tar_path = install_dir / "candid-extractor-linux-amd64.tar.gz"
 
     print(f"Downloading candid-extractor from {url}...")
-    urllib.request.urlretrieve(url, tar_path)
-
-    with tarfile.open(tar_path, "r:gz") as tar:
-        tar.extractall(install_dir)
-
-    tar_path.unlink()
+    download_and_extract(url, install_dir)
     binary_path.chmod(0o755)
 
     if symlink_path.exists():
@@ -159,12 +224,24 @@ def test_build(wasi_sdk_root):
 
 
 def main():
+    try:
+        setup()
+    finally:
+        flush_exports()
+
+
+def setup():
     os.chdir(SCRIPT_DIR)
 
-    ensure_build_tools()
-    wasi_sdk_root = ensure_wasi_sdk()
+    # The two downloads are independent of each other and of apt-get, so
+    # fetch them in the background while the build tools install.
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        wasi_sdk_future = pool.submit(ensure_wasi_sdk)
+        candid_extractor_future = pool.submit(ensure_candid_extractor)
+        ensure_build_tools()
+        wasi_sdk_root = wasi_sdk_future.result()
+        candid_extractor_future.result()
     persist_export("export WASI_SDK_ROOT=", f'export WASI_SDK_ROOT="{wasi_sdk_root}"')
-    ensure_candid_extractor()
     ensure_uv()
     ensure_venv()
     install_requirements()
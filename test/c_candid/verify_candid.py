@@ -18,6 +18,10 @@ for var in [
 
 from ic.candid import decode
 
+VERBOSE = "-v" in sys.argv
+# Bytes shown in the hex line unless -v asks for a full dump.
+HEX_PREVIEW = 64
+
 
 def verify_file(filename):
     """Verify a Candid binary file"""
@@ -28,7 +32,10 @@ def verify_file(filename):
             data = f.read()
 
         print(f"File size: {len(data)} bytes")
-        print(f"Hex: {data.hex()}")
+        if VERBOSE or len(data) <= HEX_PREVIEW:
+            print(f"Hex: {data.hex()}")
+        else:
+            print(f"Hex: {data[:HEX_PREVIEW].hex()}... (-v for all {len(data)} bytes)")
 
         # Check DIDL magic
         if data[:4] != b"DIDL":
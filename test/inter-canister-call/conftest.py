@@ -0,0 +1,21 @@
+"""Shared pytest fixtures for the inter-canister-call PocketIC tests."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path for imports
+project_root = Path(__file__).resolve().parent.parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from test.support.test_support_pocketic import install_multiple_examples
+
+
+@pytest.fixture(scope="session")
+def pic_with_adder_and_caller():
+    """Build and install adder + inter-canister-call once for the whole session."""
+    return install_multiple_examples(["adder", "inter-canister-call"], auto_build=True)
@@ -4,57 +4,100 @@ Python agent example for interacting with IC canisters.
 Prerequisites:
 1. Start the local IC network: dfx start
 2. Script will run `dfx deploy` in `examples/adder` and `examples/inter-canister-call`
-3. Get the canister ID from dfx deploy output and update CID below
+3. Canister IDs are looked up with `dfx canister id` after deploying
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+import functools
 import os
 import subprocess
+import sys
+
+# Add project root to path for imports
+project_root = Path(__file__).resolve().parent.parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
 from ic.client import Client
 from ic.identity import Identity
 from ic.agent import Agent
 from ic.candid import encode, Types
+from test.support.test_support_build import example_wasm_is_fresh, stream_cmd
 
 
-def run_cmd(command, workdir: Path) -> None:
-    """Run a command in the given directory and print stdout/stderr."""
-    result = subprocess.run(
+EXAMPLES = ("adder", "inter-canister-call")
+# Default local IC network URL (default for dfx start)
+IC_NETWORK_URL = "http://127.0.0.1:4943"
+
+
+def run_cmd(command, workdir: Path, prefix: str = "") -> None:
+    """Run a command in the given directory, streaming its output."""
+    stream_cmd(
         command,
-        cwd=workdir,
-        text=True,
-        capture_output=True,
-        check=False,
+        workdir,
+        prefix=prefix,
         env={**os.environ, "DFX_DISABLE_COLOR": "1"},
+        out=sys.stdout,
     )
-    if result.stdout:
-        print(result.stdout.strip())
-    if result.stderr:
-        print(result.stderr.strip())
-    if result.returncode != 0:
-        raise subprocess.CalledProcessError(
-            result.returncode, command, result.stdout, result.stderr
-        )
 
 
 def build_examples() -> None:
-    """Build example canisters before deployment."""
-    project_root = Path(__file__).resolve().parents[2]
-    for example in ("adder", "inter-canister-call"):
-        print(f"Building example {example} ...")
-        run_cmd(
-            ["python", "build.py", "--icwasm", "--examples", example],
-            project_root,
-        )
+    """Build example canisters before deployment, skipping up-to-date ones."""
+    stale = [example for example in EXAMPLES if not example_wasm_is_fresh(example)]
+    if not stale:
+        print(f"Examples {', '.join(EXAMPLES)} are up to date, skipping build.")
+        return
+    # One build.py run for all examples: they share the build-wasi tree, and
+    # ninja already parallelises across targets.
+    print(f"Building examples {', '.join(stale)} ...")
+    run_cmd(
+        ["python", "build.py", "--icwasm", "--examples", *stale],
+        project_root,
+    )
+
+
+def canister_id(example: str) -> str:
+    """Return the canister ID dfx assigned to `example` on the local replica."""
+    result = subprocess.run(
+        ["dfx", "canister", "id", example],
+        cwd=project_root / "examples" / example,
+        text=True,
+        capture_output=True,
+        check=True,
+        env={**os.environ, "DFX_DISABLE_COLOR": "1"},
+    )
+    return result.stdout.strip()
 
 
 def deploy_examples() -> None:
     """Deploy example canisters required for the inter-canister call test."""
-    project_root = Path(__file__).resolve().parents[2]
-    for example in ("adder", "inter-canister-call"):
-        example_dir = project_root / "examples" / example
-        print(f"Deploying example in {example_dir} ...")
-        run_cmd(["dfx", "deploy"], example_dir)
+    # Each example is its own dfx project, so the deploys run concurrently.
+    with ThreadPoolExecutor(max_workers=len(EXAMPLES)) as pool:
+        futures = []
+        for example in EXAMPLES:
+            example_dir = project_root / "examples" / example
+            print(f"Deploying example in {example_dir} ...")
+            futures.append(
+                pool.submit(run_cmd, ["dfx", "deploy"], example_dir, f"[{example}] ")
+            )
+        for future in futures:
+            future.result()
+
+
+@functools.lru_cache(maxsize=1)
+def get_agent(url: str = IC_NETWORK_URL) -> Agent:
+    """
+    Return the agent for url, created on first use and shared by later calls.
+
+    Created lazily so it is built after main() has cleared the proxy variables.
+    """
+    # Initialize client, identity, and agent
+    client = Client(url=url)
+    # Create a new anonymous identity
+    # To use dfx identity instead, read from ~/.config/dfx/identity/default/identity.pem
+    iden = Identity()
+    return Agent(iden, client)
 
 
 def main() -> None:
@@ -72,19 +115,11 @@ def main() -> None:
     build_examples()
     deploy_examples()
 
-    # Canister ID - update this with your deployed canister IDs from 'dfx deploy' output
-    # TODO dev-exp: find a way to pass a name instead of generated canister ID, a tool to KV store it .
-    callee = "vt46d-j7777-77774-qaagq-cai"  # adder canister
-    caller = "v56tl-sp777-77774-qaahq-cai"  # inter-canister-call canister
-    # Default local IC network URL (default for dfx start)
-    ic_network_url = "http://127.0.0.1:4943"
-
-    # Initialize client, identity, and agent
-    client = Client(url=ic_network_url)
-    # Create a new anonymous identity
-    # To use dfx identity instead, read from ~/.config/dfx/identity/default/identity.pem
-    iden = Identity()
-    agent = Agent(iden, client)
+    # The deploys run concurrently, so creation order (and hence the IDs on a
+    # fresh replica) varies; look the IDs up by canister name instead.
+    callee = canister_id("adder")
+    caller = canister_id("inter-canister-call")
+    agent = get_agent()
 
     print("inter-canister call increment:")
     # 3) Update call: trigger_call (requires principal parameter)
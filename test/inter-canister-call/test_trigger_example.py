@@ -28,13 +28,12 @@ from test.support.test_support_pocketic import (
 )
 
 
-def test_trigger() -> None:
+def test_trigger(pic_with_adder_and_caller) -> None:
     """End-to-end test for `trigger_call(text) -> (text)`."""
     print("=== test_trigger: start ===")
-    # 1. Install two canisters (adder and inter-canister-call) on the same PocketIC instance
-    pic, ids = install_multiple_examples(
-        ["adder", "inter-canister-call"], auto_build=True
-    )
+    # 1. Two canisters (adder and inter-canister-call) share one PocketIC
+    #    instance, installed once per session by the conftest fixture
+    pic, ids = pic_with_adder_and_caller
     adder_id = ids["adder"]
     caller_id = ids["inter-canister-call"]
 
@@ -66,4 +65,6 @@ def test_trigger() -> None:
 
 
 if __name__ == "__main__":
-    test_trigger()
+    test_trigger(
+        install_multiple_examples(["adder", "inter-canister-call"], auto_build=True)
+    )
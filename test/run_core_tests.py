@@ -18,14 +18,21 @@ This script follows the testing framework plan:
 2. Build and run native C tests (via `python build.py --test`)
 3. Run Python PocketIC integration tests
 
+Steps 1 and 2 use separate build trees (build-wasi/ and build/), so they run
+concurrently; step 3 needs step 1's wasm and starts once both have finished.
+
 This script intentionally keeps the logic simple and explicit so it is easy to
 maintain and extend later (for example, to add more pytest targets).
 """
 
 from __future__ import annotations
 
+import os
+import signal
 import subprocess
 import sys
+import threading
+import time
 from pathlib import Path
 
 
@@ -54,28 +61,120 @@ def run(cmd: list[str], cwd: Path, description: str = "") -> int:
     return completed.returncode
 
 
+def start(cmd: list[str], cwd: Path, tag: str, description: str = "") -> subprocess.Popen:
+    """
+    Start a command in the background, prefixing each output line with tag.
+
+    The caller waits on the returned process; the relay thread exits when the
+    process closes its output.
+    """
+    if description:
+        sys.stderr.write(f"[core-tests] {description}\n")
+    sys.stderr.write(f"[core-tests] Running: {' '.join(cmd)} (cwd={cwd})\n")
+    sys.stderr.flush()
+    proc = subprocess.Popen(
+        cmd,
+        cwd=str(cwd),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1,
+        # Own process group, so terminate_all() also stops ninja/ctest children.
+        start_new_session=True,
+    )
+
+    def relay() -> None:
+        for line in proc.stdout:
+            # One write per line, so lines from the two steps never tear.
+            sys.stderr.write(f"{tag} {line}")
+            sys.stderr.flush()
+
+    thread = threading.Thread(target=relay, daemon=True)
+    thread.start()
+    proc.relay_thread = thread  # type: ignore[attr-defined]
+    return proc
+
+
+def terminate_all(procs: dict[str, subprocess.Popen]) -> None:
+    """Send SIGTERM to the process group of every process still running."""
+    for proc in procs.values():
+        if proc.poll() is None:
+            try:
+                os.killpg(proc.pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+
+def wait_all(procs: dict[str, subprocess.Popen]) -> dict[str, int]:
+    """
+    Wait for every process, terminating the rest as soon as one fails.
+
+    Returns the exit code of each process, keyed like procs.
+    """
+    codes: dict[str, int] = {}
+    try:
+        while len(codes) < len(procs):
+            for name, proc in procs.items():
+                if name in codes or proc.poll() is None:
+                    continue
+                codes[name] = proc.returncode
+                if proc.returncode != 0:
+                    terminate_all(procs)
+            time.sleep(0.1)
+    except KeyboardInterrupt:
+        # The children are in their own sessions and did not see the Ctrl-C.
+        terminate_all(procs)
+        raise
+    for proc in procs.values():
+        proc.relay_thread.join()  # type: ignore[attr-defined]
+    return codes
+
+
 def main() -> int:
     repo_root = find_repo_root()
 
+    # Steps 1 and 2 run side by side, so each gets half the CPUs instead of
+    # both running `ninja -j <cpu count>`.
+    jobs = str(max(1, (os.cpu_count() or 2) // 2))
+
     # Step 1: Build IC WASM (validates SDK compiles for IC platform)
     # This follows the plan requirement: "Run python build.py --icwasm"
-    icwasm_cmd = [sys.executable, "build.py", "--icwasm"]
-    code = run(icwasm_cmd, cwd=repo_root, description="Step 1: Building IC WASM...")
-    if code != 0:
-        sys.stderr.write("[core-tests] IC WASM build failed.\n")
-        return code
+    # The native build owns the root compile_commands.json, so the two
+    # concurrent builds don't race to overwrite it.
+    icwasm_cmd = [
+        sys.executable, "build.py", "--icwasm", "--jobs", jobs, "--no-compile-commands",
+    ]
 
     # Step 2: Native build + C/CTest-based tests
     # This runs cdk-c/test/* and test/c_candid/* tests via CMake/ctest
-    build_test_cmd = [sys.executable, "build.py", "--test"]
-    code = run(
-        build_test_cmd,
-        cwd=repo_root,
-        description="Step 2: Building and running native C tests...",
+    build_test_cmd = [sys.executable, "build.py", "--test", "--jobs", jobs]
+
+    # Steps 1 and 2 build into different directories, so run them together.
+    codes = wait_all(
+        {
+            "icwasm": start(
+                icwasm_cmd,
+                cwd=repo_root,
+                tag="[icwasm]",
+                description="Step 1: Building IC WASM...",
+            ),
+            "ctest": start(
+                build_test_cmd,
+                cwd=repo_root,
+                tag="[ctest]",
+                description="Step 2: Building and running native C tests...",
+            ),
+        }
     )
-    if code != 0:
-        sys.stderr.write("[core-tests] Native build or C tests failed.\n")
-        return code
+    failures = {
+        "icwasm": "IC WASM build failed.",
+        "ctest": "Native build or C tests failed.",
+    }
+    # A step we terminated exits with -SIGTERM; report the one that failed.
+    for name in sorted(failures, key=lambda n: codes[n] < 0):
+        if codes[name] != 0:
+            sys.stderr.write(f"[core-tests] {failures[name]}\n")
+            return codes[name]
 
     # Step 3: Python-level core tests that live under test/
     # These are focused on core SDK behavior, not examples.
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""Unit tests for example_wasm_is_fresh (the --no-rebuild / icc.py skip check)."""
+
+import os
+import sys
+from pathlib import Path
+
+# Add project root to path for imports
+project_root = Path(__file__).resolve().parent.parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from test.support import test_support_build
+from test.support.test_support_build import example_wasm_is_fresh
+
+
+def _write(path: Path, mtime: float) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("x")
+    os.utime(path, (mtime, mtime))
+
+
+def test_fresh_until_a_source_is_touched(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(test_support_build, "find_repo_root", lambda: tmp_path)
+    _write(tmp_path / "examples" / "demo" / "demo.c", 1000)
+    _write(tmp_path / "cdk-c" / "include" / "ic.h", 1000)
+    _write(tmp_path / "build-wasi" / "bin" / "demo_ic.wasm", 2000)
+    # build.py regenerates the .did after the wasm; it must not count as a source
+    _write(tmp_path / "examples" / "demo" / "demo.did", 3000)
+
+    assert example_wasm_is_fresh("demo")
+
+    os.utime(tmp_path / "examples" / "demo" / "demo.c", (4000, 4000))
+    assert not example_wasm_is_fresh("demo")
+
+
+def test_shared_library_change_makes_stale(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(test_support_build, "find_repo_root", lambda: tmp_path)
+    _write(tmp_path / "examples" / "demo" / "demo.c", 1000)
+    _write(tmp_path / "build-wasi" / "bin" / "demo_ic.wasm", 2000)
+    _write(tmp_path / "cdk-c" / "src" / "ic_api.c", 3000)
+
+    assert not example_wasm_is_fresh("demo")
+
+
+def test_missing_wasm_is_not_fresh(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(test_support_build, "find_repo_root", lambda: tmp_path)
+    _write(tmp_path / "examples" / "demo" / "demo.c", 1000)
+
+    assert not example_wasm_is_fresh("demo")
@@ -5,26 +5,48 @@ Build- and path-related helpers for example canisters.
 This module is intentionally generic so it can be reused for multiple
 examples. It:
   - locates the project root (where build.py lives)
-  - runs `python build.py --icwasm --examples <example>`
+  - runs `python build.py --icwasm --examples <example> [...]`
   - resolves the resulting `<example>_ic.wasm` and `<example>.did` paths
+  - tells whether a built wasm is newer than the sources it came from
+  - streams a command's output line by line (stream_cmd)
 """
 
 from __future__ import annotations
 
+import contextlib
+import functools
+import os
 import subprocess
 import sys
+import threading
 from pathlib import Path
-from typing import Tuple
+from typing import Mapping, Sequence, TextIO, Tuple
+
+# Library trees compiled into every example canister.
+_SHARED_SOURCE_DIRS = ("cdk-c", "c_candid", "cdk_alloc")
+_SOURCE_SUFFIXES = {".c", ".h", ".txt", ".cmake", ".did"}
+
+# Held per write, so concurrent stream_cmd calls interleave whole lines.
+_output_lock = threading.Lock()
+# Largest read stream_cmd takes from a child's pipe.
+_STREAM_CHUNK = 65536
 
 
 def find_repo_root(start: Path | None = None) -> Path:
     """
     Locate the repository root by searching upwards for build.py.
     Falls back to the current directory if not found.
+
+    The walk is cached per starting directory, since every helper below
+    asks for the root again.
     """
     if start is None:
         start = Path(__file__).resolve()
+    return _find_repo_root_from(Path(start))
+
 
+@functools.lru_cache(maxsize=None)
+def _find_repo_root_from(start: Path) -> Path:
     for parent in [start] + list(start.parents):
         if (parent / "build.py").exists():
             return parent
@@ -32,10 +54,77 @@ def find_repo_root(start: Path | None = None) -> Path:
     return start
 
 
+def stream_cmd(
+    cmd: Sequence[str],
+    cwd: Path,
+    *,
+    prefix: str = "",
+    env: Mapping[str, str] | None = None,
+    out: TextIO | None = None,
+) -> None:
+    """
+    Run cmd in cwd, echoing its combined stdout/stderr to out (default:
+    sys.stderr, which bypasses pytest's stdout capture), prefixing each line.
+
+    Output is forwarded in whatever chunks the pipe delivers (up to 64 KiB)
+    rather than one write per line. Only complete lines are written, so
+    concurrent callers still interleave whole lines, and memory stays
+    O(chunk) for long builds.
+
+    Raises subprocess.CalledProcessError if the command fails.
+    """
+    if out is None:
+        out = sys.stderr
+
+    def emit(data: bytes) -> None:
+        text = data.decode("utf-8", errors="replace")
+        if prefix:
+            text = "".join(prefix + line for line in text.splitlines(keepends=True))
+        with _output_lock:
+            out.write(text)
+            out.flush()
+
+    process = subprocess.Popen(
+        cmd,
+        cwd=cwd,
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+    )
+    fd = process.stdout.fileno()
+    partial = b""
+    # os.read returns as soon as any output is available, so this stays live.
+    for chunk in iter(functools.partial(os.read, fd, _STREAM_CHUNK), b""):
+        # Splitting on b"\n" never cuts a UTF-8 sequence in half.
+        lines, newline, partial = (partial + chunk).rpartition(b"\n")
+        if newline:
+            emit(lines + newline)
+    if partial:
+        emit(partial)
+    process.stdout.close()
+    process.wait()
+    if process.returncode != 0:
+        raise subprocess.CalledProcessError(process.returncode, cmd)
+
+
 def build_example_ic_wasm(example_name: str) -> None:
     """
     Run `python build.py --icwasm --examples <example_name>` from the repo root.
 
+    Raises subprocess.CalledProcessError if the build fails.
+    """
+    build_examples_ic_wasm([example_name])
+
+
+def build_examples_ic_wasm(example_names: list[str]) -> None:
+    """
+    Run `python build.py --icwasm --examples <name> [<name> ...]` once for
+    several examples.
+
+    All examples share the build-wasi CMake tree, so they are built in a
+    single invocation (ninja parallelises across them) rather than by
+    concurrent build.py processes racing on the same build directory.
+
     Raises subprocess.CalledProcessError if the build fails.
     """
     repo_root = find_repo_root()
@@ -44,61 +133,115 @@ def build_example_ic_wasm(example_name: str) -> None:
         "build.py",
         "--icwasm",
         "--examples",
-        example_name,
+        *example_names,
     ]
-    # Use sys.stderr to bypass pytest's stdout capture
-    # This ensures build output is always visible
-    sys.stderr.write(f"[build] Running: {' '.join(cmd)} (cwd={repo_root})\n")
-    sys.stderr.flush()
-    
-    # Capture and display build output in real-time
-    process = subprocess.Popen(
-        cmd,
-        cwd=repo_root,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.STDOUT,
-        text=True,
-        bufsize=1,  # Line buffered
-    )
-    
-    # Print output line by line to stderr to bypass pytest capture
-    for line in process.stdout:
-        sys.stderr.write(f"[build] {line}")
+    # Parallel test workers (pytest-xdist) share build-wasi, so only one
+    # build.py may run at a time. Post-processing rewrites every _ic.wasm and
+    # .did in place, so a worker that finds the build already done by another
+    # skips it instead of rewriting files the others may be reading.
+    with build_lock():
+        if os.environ.get("PYTEST_XDIST_WORKER") and all(
+            example_wasm_is_fresh(name) for name in example_names
+        ):
+            sys.stderr.write(f"[build] {', '.join(example_names)} already built, skipping\n")
+            sys.stderr.flush()
+            return
+
+        # Use sys.stderr to bypass pytest's stdout capture
+        # This ensures build output is always visible
+        sys.stderr.write(f"[build] Running: {' '.join(cmd)} (cwd={repo_root})\n")
         sys.stderr.flush()
-    
-    process.wait()
-    if process.returncode != 0:
-        raise subprocess.CalledProcessError(process.returncode, cmd)
+        stream_cmd(cmd, repo_root, prefix="[build] ")
+
 
+@contextlib.contextmanager
+def build_lock(*, shared: bool = False):
+    """
+    Hold build-wasi/.build.lock: exclusively while build.py rewrites the
+    artifacts, shared while a test reads them.
+
+    Without fcntl (Windows) this is a no-op.
+    """
+    try:
+        import fcntl
+    except ImportError:
+        yield
+        return
 
+    lock_path = find_repo_root() / "build-wasi" / ".build.lock"
+    lock_path.parent.mkdir(exist_ok=True)
+    with open(lock_path, "a") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+        yield
+
+
+@functools.lru_cache(maxsize=32)
 def get_wasm_and_did_paths(example_name: str) -> Tuple[Path, Path]:
     """
     Resolve the paths to:
       - build-wasi/bin/<example_name>_ic.wasm
       - examples/<example_name>/<example_name>.did
     relative to the repo root.
+
+    Successful lookups are cached per example. The paths never move, and
+    rebuilds overwrite the files in place. Failures are not cached, so a
+    later build is picked up.
     """
     repo_root = find_repo_root()
 
     bin_dir = repo_root / "build-wasi" / "bin"
-    if not bin_dir.exists():
-        raise FileNotFoundError(
-            f"Bin directory not found: {bin_dir}. Did you run build_example_ic_wasm?"
-        )
-
     wasm_name = f"{example_name}_ic.wasm"
     wasm_path = bin_dir / wasm_name
-    if not wasm_path.exists():
+    # One stat on the happy path; the bin dir is only checked to pick the error.
+    try:
+        wasm_path.stat()
+    except FileNotFoundError:
+        if not bin_dir.exists():
+            raise FileNotFoundError(
+                f"Bin directory not found: {bin_dir}. Did you run build_example_ic_wasm?"
+            ) from None
         raise FileNotFoundError(
             f"WASM not found: {wasm_path}. "
             f"Make sure example '{example_name}' is built and post-processed."
-        )
+        ) from None
 
     did_path = repo_root / "examples" / example_name / f"{example_name}.did"
-    if not did_path.exists():
+    try:
+        did_path.stat()
+    except FileNotFoundError:
         raise FileNotFoundError(
             f"DID file not found: {did_path}. "
             f"Expected '{example_name}.did' next to the example sources."
-        )
+        ) from None
 
     return wasm_path, did_path
+
+
+def example_wasm_is_fresh(example_name: str) -> bool:
+    """
+    Return True if `<example_name>_ic.wasm` exists and is newer than every
+    C/CMake/DID source in the example directory and the shared library trees.
+
+    `examples/<name>/<name>.did` is not a source: build.py's candid step
+    regenerates it from the wasm after every build, so it is always newer.
+
+    Used to skip `build.py` when nothing has changed since the last build.
+    """
+    repo_root = find_repo_root()
+    wasm_path = repo_root / "build-wasi" / "bin" / f"{example_name}_ic.wasm"
+    try:
+        built = wasm_path.stat().st_mtime
+    except FileNotFoundError:
+        return False
+
+    example_dir = repo_root / "examples" / example_name
+    generated_did = example_dir / f"{example_name}.did"
+    roots = [example_dir]
+    roots += [repo_root / name for name in _SHARED_SOURCE_DIRS]
+    for root in roots:
+        for path in root.rglob("*"):
+            if path.suffix not in _SOURCE_SUFFIXES or path == generated_did:
+                continue
+            if path.stat().st_mtime > built:
+                return False
+    return True
@@ -10,18 +10,33 @@ Responsibilities:
 
 from __future__ import annotations
 
+import functools
 import os
+import re
+import string
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
 from pocket_ic import PocketIC
 from ic.candid import encode
 from ic.principal import Principal
-from .test_support_build import build_example_ic_wasm, get_wasm_and_did_paths
+from .test_support_build import (
+    build_example_ic_wasm,
+    build_lock,
+    build_examples_ic_wasm,
+    example_wasm_is_fresh,
+    get_wasm_and_did_paths,
+)
+
+# Trailing run of printable ASCII in a DIDL reply (where a text value ends up).
+_PRINTABLE_TAIL_RE = re.compile(rb"[\x20-\x7E]+$")
+# Bytes outside string.printable; non-ASCII bytes never survive the filter.
+_NON_PRINTABLE_BYTES = bytes(b for b in range(256) if chr(b) not in string.printable)
+# Candid encoding of an empty argument tuple, shared by every no-arg call.
+_EMPTY_ARGS = encode([])
 
 
-# TODO performance: 1. make pocket-it asnyc init to prepare for service call, because it takes ~3s
-# TODO 2.give a flag to mannually skip build, because autoskip in build.py is not impl yet
 def setup_pocketic_binary() -> None:
     """
     Ensure POCKET_IC_BIN is set, preferring a `pocket-ic` binary
@@ -50,6 +65,26 @@ def setup_pocketic_binary() -> None:
                 sys.stderr.flush()
 
 
+def _install_one(pic: PocketIC, wasm_path: Path, did_path: Path) -> Principal:
+    """
+    Create a canister in `pic` and install the given WASM/DID into it.
+
+    Shared core of install_example_canister and install_multiple_examples.
+    """
+    # Shared lock: another xdist worker's build.py may be rewriting these.
+    with build_lock(shared=True):
+        candid = did_path.read_text()
+        wasm_module = wasm_path.read_bytes()
+    canister = pic.create_and_install_canister_with_candid(
+        candid=candid,
+        wasm_module=wasm_module,
+    )
+    principal_id = canister.canister_id
+    # PocketIC already hands back a Principal; fail fast if that changes
+    assert isinstance(principal_id, Principal), type(principal_id)
+    return principal_id
+
+
 def install_example_canister(
     example_name: str,
     *,
@@ -63,36 +98,60 @@ def install_example_canister(
     """
     setup_pocketic_binary()
 
-    if auto_build:
-        build_example_ic_wasm(example_name)
+    # PocketIC start-up (~3s) only needs the binary, so it overlaps the build.
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        pic_future = pool.submit(PocketIC)
 
-    wasm_path, did_path = get_wasm_and_did_paths(example_name)
+        if auto_build:
+            build_example_ic_wasm(example_name)
 
-    import sys
-    # Use stderr to ensure output is visible even when pytest captures stdout
-    sys.stderr.write(f"[install] WASM: {wasm_path}\n")
-    sys.stderr.write(f"[install] DID:  {did_path}\n")
-    sys.stderr.flush()
+        wasm_path, did_path = get_wasm_and_did_paths(example_name)
+
+        import sys
+        # Use stderr to ensure output is visible even when pytest captures stdout
+        sys.stderr.write(f"[install] WASM: {wasm_path}\n")
+        sys.stderr.write(f"[install] DID:  {did_path}\n")
+        sys.stderr.flush()
 
-    pic = PocketIC()
+        pic = pic_future.result()
     sys.stderr.write("[install] PocketIC initialized\n")
     sys.stderr.flush()
 
-    with open(wasm_path, "rb") as f:
-        wasm_module = f.read()
-    with open(did_path, "r") as f:
-        candid_interface = f.read()
-
-    canister = pic.create_and_install_canister_with_candid(
-        candid=candid_interface,
-        wasm_module=wasm_module,
-    )
-    canister_id = canister.canister_id
+    canister_id = _install_one(pic, wasm_path, did_path)
     sys.stderr.write(f"[install] Canister ID: {canister_id}\n")
     sys.stderr.flush()
     return pic, canister_id
 
 
+# example_name -> (PocketIC, canister_id) installed by install_example_canister_cached
+_installed_examples: dict[str, tuple[PocketIC, str]] = {}
+
+
+def install_example_canister_cached(
+    example_name: str,
+    *,
+    auto_build: bool = True,
+    skip_fresh_build: bool = False,
+) -> tuple[PocketIC, str]:
+    """
+    Like install_example_canister, but install each example at most once per
+    process so several test modules can share the canister.
+
+    With skip_fresh_build, the build is skipped when the wasm is already newer
+    than its sources (see example_wasm_is_fresh).
+    """
+    installed = _installed_examples.get(example_name)
+    if installed is None:
+        if auto_build and skip_fresh_build and example_wasm_is_fresh(example_name):
+            import sys
+            sys.stderr.write(f"[install] {example_name}_ic.wasm is up to date, skipping build\n")
+            sys.stderr.flush()
+            auto_build = False
+        installed = install_example_canister(example_name, auto_build=auto_build)
+        _installed_examples[example_name] = installed
+    return installed
+
+
 def install_multiple_examples(
     example_names: list[str],
     *,
@@ -110,37 +169,25 @@ def install_multiple_examples(
 
     setup_pocketic_binary()
 
-    if auto_build:
-        for name in example_names:
-            build_example_ic_wasm(name)
+    # As in install_example_canister, start PocketIC while the build runs.
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        pic_future = pool.submit(PocketIC)
+
+        if auto_build:
+            build_examples_ic_wasm(example_names)
 
-    wasm_did_paths: dict[str, tuple[Path, Path]] = {}
-    for name in example_names:
-        wasm_path, did_path = get_wasm_and_did_paths(name)
-        wasm_did_paths[name] = (wasm_path, did_path)
+        wasm_did_paths: dict[str, tuple[Path, Path]] = {}
+        for name in example_names:
+            wasm_path, did_path = get_wasm_and_did_paths(name)
+            wasm_did_paths[name] = (wasm_path, did_path)
 
-    pic = PocketIC()
+        pic = pic_future.result()
     print("[install-multi] PocketIC initialized")
 
     ids: dict[str, Principal] = {}
     for name, (wasm_path, did_path) in wasm_did_paths.items():
         print(f"[install-multi] Installing '{name}'")
-        with open(wasm_path, "rb") as f:
-            wasm_module = f.read()
-        with open(did_path, "r") as f:
-            candid_interface = f.read()
-
-        canister = pic.create_and_install_canister_with_candid(
-            candid=candid_interface,
-            wasm_module=wasm_module,
-        )
-        canister_id = canister.canister_id
-        # Normalize to Principal explicitly for clarity
-        if isinstance(canister_id, Principal):
-            principal_id = canister_id
-        else:
-            principal_id = Principal.from_str(str(canister_id))
-
+        principal_id = _install_one(pic, wasm_path, did_path)
         ids[name] = principal_id
         print(f"[install-multi]  -> {name} ID: {principal_id}")
 
@@ -158,26 +205,27 @@ def decode_candid_text(response_bytes: bytes) -> str:
 
     try:
         if data.startswith(b"DIDL"):
-            import re
-
-            text_content = re.search(b"[\\x20-\\x7E]+$", data)
+            text_content = _PRINTABLE_TAIL_RE.search(data)
             if text_content:
                 return text_content.group(0).decode("utf-8", errors="ignore")
     except Exception:
         pass
 
     try:
-        decoded = data.decode("utf-8", errors="ignore")
-        import string
-
-        return "".join(ch for ch in decoded if ch in string.printable).strip()
+        return data.translate(None, _NON_PRINTABLE_BYTES).decode("ascii").strip()
     except Exception:
         return str(response_bytes)
 
 
+@functools.lru_cache(maxsize=64)
+def _principal(canister_id: str) -> Principal:
+    """Parse (and memoize) a textual canister id."""
+    return Principal.from_str(canister_id)
+
+
 def query_and_expect_substr(
     pic: PocketIC,
-    canister_id: str,
+    canister_id: Principal | str,
     method: str,
     expected_substr: Optional[str] = None,
 ) -> str:
@@ -185,23 +233,36 @@ def query_and_expect_substr(
     Perform an UPDATE call with no arguments and (optionally) assert that
     the response contains a given substring.
 
-    Returns the (approximately) decoded text response.
+    Returns the (approximately) decoded text response. When expected_substr
+    already matches the raw reply bytes as UTF-8, the heuristic decode is
+    skipped and expected_substr itself is returned.
     """
     print(f"\n=== update {method}() ===")
-    payload = encode([])  # Empty args
-    response_bytes = pic.update_call(Principal.from_str(canister_id), method, payload)
+    if not isinstance(canister_id, Principal):
+        canister_id = _principal(canister_id)
+    response_bytes = pic.update_call(canister_id, method, _EMPTY_ARGS)
 
     print(f"Raw response: {response_bytes}")
+    if (
+        expected_substr is not None
+        and isinstance(response_bytes, (bytes, bytearray))
+        and expected_substr.encode("utf-8") in response_bytes
+    ):
+        print(f"✓ contains expected substring: {expected_substr!r}")
+        return expected_substr
+
     decoded = decode_candid_text(response_bytes)
     print(f"Decoded text (approx): {decoded!r}")
-
-    if expected_substr is not None:
-        if expected_substr in decoded:
-            print(f"✓ contains expected substring: {expected_substr!r}")
-        else:
-            raise AssertionError(
-                f"Expected substring {expected_substr!r} not found in response {decoded!r}"
-            )
+    if expected_substr is None:
+        return decoded
+
+    # The heuristic decode can join text across stripped bytes, so a raw miss
+    # still falls back to checking the decoded text before failing.
+    if expected_substr in decoded:
+        print(f"✓ contains expected substring: {expected_substr!r}")
+    else:
+        raise AssertionError(
+            f"Expected substring {expected_substr!r} not found in response {decoded!r}"
+        )
 
     return decoded
-